@@ -173,7 +173,8 @@ def upload_file():
         else:
             parser = CSVParser(input_path)
 
-        transactions = parser.parse()
+        with parser:
+            transactions = parser.parse()
 
         if not transactions:
             return jsonify({'error': 'No transactions found in the file. Please check the file format.'}), 400
@@ -255,24 +256,23 @@ def upload_file():
 def _process_pdf_pnl(input_path: str, original_filename: str, unique_id: str):
     """Handle PDF upload: extract P&L line items and return results."""
     try:
-        pdf_parser = PDFPnLParser(input_path)
-
-        # Step 1: Identify P&L pages
-        pnl_pages = pdf_parser.identify_pnl_pages()
-        if not pnl_pages:
-            return jsonify({
-                'error': (
-                    'Could not identify any pages containing P&L data in the PDF. '
-                    'The document may not contain a Profit & Loss statement, '
-                    'or the text is not extractable (scanned image).'
-                )
-            }), 400
-
-        # Step 2: Extract line items
-        try:
-            line_items = pdf_parser.extract_all()
-        except ExtractionError as e:
-            return jsonify({'error': f'Extraction failed: {e}'}), 400
+        with PDFPnLParser(input_path) as pdf_parser:
+            # Step 1: Identify P&L pages
+            pnl_pages = pdf_parser.identify_pnl_pages()
+            if not pnl_pages:
+                return jsonify({
+                    'error': (
+                        'Could not identify any pages containing P&L data in the PDF. '
+                        'The document may not contain a Profit & Loss statement, '
+                        'or the text is not extractable (scanned image).'
+                    )
+                }), 400
+
+            # Step 2: Extract line items
+            try:
+                line_items = pdf_parser.extract_all()
+            except ExtractionError as e:
+                return jsonify({'error': f'Extraction failed: {e}'}), 400
 
         # Step 3: Generate output Excel
         output_filename = f"pnl_extracted_{unique_id}.xlsx"
@@ -3,6 +3,7 @@ Main categorization orchestrator.
 
 Combines rule-based and Haiku API categorization with confidence-based flagging.
 """
+import sys
 from typing import List, Optional, Tuple
 
 from config import DEFAULT_CONFIDENCE_THRESHOLD
@@ -11,6 +12,11 @@ from categorizer.rules import rule_based_categorize
 from parsers.base_parser import Transaction
 
 
+def _intern(value):
+    """Intern a string decoded from an API response; pass anything else through."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class TransactionCategorizer:
     """
     Orchestrates transaction categorization using rules and Haiku API.
@@ -154,6 +160,11 @@ class TransactionCategorizer:
 
         category, subcategory, confidence = result
 
+        # Rule matches already share the rule table's strings; Haiku
+        # decodes fresh copies of the same few names for every transaction
+        category = _intern(category)
+        subcategory = _intern(subcategory)
+
         if confidence >= self.confidence_threshold:
             txn.category = category
             txn.subcategory = subcategory
@@ -7,6 +7,7 @@ This module provides a flexible, configurable rule matching system that:
 - Uses semantic understanding of transaction types
 - Provides confidence-weighted matching
 """
+import functools
 import os
 import re
 from dataclasses import dataclass
@@ -71,6 +72,40 @@ class KeywordMatcher:
             for var in variations:
                 self._reverse_normalizations[var.lower()] = canonical
 
+        # Keyword list -> one fused pattern matching any of its positive
+        # keywords, so lists with no hit are rejected in a single scan
+        self._any_keyword_patterns: Dict[Tuple[str, ...], re.Pattern] = {}
+
+        # Every rule normalizes the same description again; memoize it
+        self.normalize_text = functools.lru_cache(maxsize=4096)(self.normalize_text)
+
+    @staticmethod
+    def _keyword_regex(keyword: str) -> str:
+        """
+        Regex source equivalent to match_keyword(text, keyword).
+
+        Mirrors the length-based boundary rules in match_keyword.
+        """
+        keyword = keyword.lower().strip()
+        if len(keyword) <= 2:
+            return r'(?:^|\s)' + re.escape(keyword) + r'(?:\s|$)'
+        if len(keyword) <= 4:
+            return r'\b' + re.escape(keyword) + r'\b'
+        return re.escape(keyword)
+
+    def _any_keyword_pattern(self, keywords: List[str]) -> re.Pattern:
+        """Return the cached fused pattern for a list's positive keywords."""
+        key = tuple(keywords)
+        pattern = self._any_keyword_patterns.get(key)
+        if pattern is None:
+            positives = [kw for kw in keywords if not kw.startswith('!')]
+            # An empty alternation would match everything; (?!) never does
+            pattern = re.compile(
+                '|'.join(map(self._keyword_regex, positives)) or '(?!)'
+            )
+            self._any_keyword_patterns[key] = pattern
+        return pattern
+
     def normalize_text(self, text: str) -> str:
         """
         Normalize transaction description for better matching.
@@ -153,6 +188,10 @@ class KeywordMatcher:
         """
         text_normalized = self.normalize_text(text)
 
+        # Nothing below can succeed unless some positive keyword matches
+        if not self._any_keyword_pattern(keywords).search(text_normalized):
+            return False, ""
+
         # Check negative keywords first
         if negative_keywords:
             for neg_kw in negative_keywords:
@@ -227,6 +266,17 @@ class RuleEngine:
 
         self._build_smart_rules()
 
+        # Statements repeat descriptions (SIPs, rent, subscriptions) month
+        # after month; the description-only rule pass is memoized per engine
+        self._match_description = functools.lru_cache(maxsize=4096)(
+            self._match_description
+        )
+
+    def clear_cache(self) -> None:
+        """Drop memoized matches, e.g. after editing custom_rules in place."""
+        self._match_description.cache_clear()
+        self.matcher.normalize_text.cache_clear()
+
     def _load_custom_rules_from_config(self) -> None:
         """Load custom rules via the Config singleton (avoids duplicate YAML reads)."""
         try:
@@ -341,6 +391,29 @@ class RuleEngine:
     ) -> Optional[MatchResult]:
         """Try all matching strategies in priority order."""
 
+        # 1-3. Rules that depend only on the description and direction
+        result = self._match_description(description, is_credit)
+        if result is not None:
+            return result
+
+        # 4. Amount-based rules (if amount provided)
+        if amount is not None:
+            result = self._match_amount_rules(description, amount, is_credit)
+            if result and result.matched:
+                return result
+
+        return None
+
+    def _match_description(
+        self,
+        description: str,
+        is_credit: bool
+    ) -> Optional[MatchResult]:
+        """
+        Run the rules that ignore the amount, in priority order.
+
+        Returns the first successful match, or None.
+        """
         # 1. User priority rules
         result = self._match_priority_rules(description)
         if result and result.matched:
@@ -351,15 +424,9 @@ class RuleEngine:
         if result and result.matched:
             return result
 
-        # 3. Smart semantic rules
+        # 3. Smart semantic rules (none of them use the amount)
         for rule_name, rule_func in self.smart_rules:
-            result = rule_func(description, amount, is_credit)
-            if result and result.matched:
-                return result
-
-        # 4. Amount-based rules (if amount provided)
-        if amount is not None:
-            result = self._match_amount_rules(description, amount, is_credit)
+            result = rule_func(description, None, is_credit)
             if result and result.matched:
                 return result
 
@@ -7,6 +7,7 @@ using the new intelligent rule engine under the hood.
 The legacy CATEGORY_RULES are still available for reference, but the
 actual categorization now uses the more flexible RuleEngine.
 """
+import functools
 import re
 from typing import Dict, List, Optional, Tuple
 
@@ -301,6 +302,39 @@ CATEGORY_RULES: List[CategoryRule] = [
 ]
 
 
+def _compile_rules(
+    rules: List[CategoryRule],
+    flags: int = 0
+) -> Tuple[List[Tuple[re.Pattern, CategoryRule]], re.Pattern]:
+    """
+    Compile the legacy rules once.
+
+    Returns the valid rules with their compiled patterns, in priority order,
+    plus one fused pattern that matches wherever any of them would.
+    Invalid patterns are dropped, as the per-call loop used to skip them.
+    """
+    compiled = []
+    for rule in rules:
+        try:
+            compiled.append((re.compile(rule[0], flags), rule))
+        except re.error:
+            continue
+    fused = '|'.join(f'(?:{pattern.pattern})' for pattern, _ in compiled)
+    return compiled, re.compile(fused or '(?!)', flags)
+
+
+# The patterns are all lowercase and descriptions are lowercased before
+# matching, so ASCII input needs no case folding. Non-ASCII input keeps
+# IGNORECASE, whose Unicode folding (e.g. KELVIN SIGN ~ 'k') lower() lacks.
+_COMPILED_RULES, _ANY_RULE_RE = _compile_rules(CATEGORY_RULES)
+
+
+@functools.lru_cache(maxsize=None)
+def _folded_rules() -> Tuple[List[Tuple[re.Pattern, CategoryRule]], re.Pattern]:
+    """IGNORECASE copy of the legacy rules, compiled on first non-ASCII input."""
+    return _compile_rules(CATEGORY_RULES, re.IGNORECASE)
+
+
 def rule_based_categorize(
     description: str,
     amount: Optional[float] = None,
@@ -346,19 +380,35 @@ def _legacy_rule_match(description: str) -> Optional[Tuple[str, str, float]]:
     if not description:
         return None
 
+    rule = _first_matching_rule(description)
+    if rule is None:
+        return None
+
+    _, category, subcategory = rule
+    return (category, subcategory, RULE_BASED_CONFIDENCE)
+
+
+def _first_matching_rule(description: str) -> Optional[CategoryRule]:
+    """Return the highest-priority legacy rule matching a description."""
     # Normalize description for matching
     desc_lower = description.lower().strip()
 
     # Remove extra whitespace
     desc_lower = ' '.join(desc_lower.split())
 
-    for pattern, category, subcategory in CATEGORY_RULES:
-        try:
-            if re.search(pattern, desc_lower, re.IGNORECASE):
-                return (category, subcategory, RULE_BASED_CONFIDENCE)
-        except re.error:
-            # Skip invalid patterns
-            continue
+    # One fused scan rules out descriptions no rule matches; otherwise the
+    # rules are tried in order so the earliest one still wins
+    if desc_lower.isascii():
+        any_rule_re, compiled_rules = _ANY_RULE_RE, _COMPILED_RULES
+    else:
+        compiled_rules, any_rule_re = _folded_rules()
+
+    if not any_rule_re.search(desc_lower):
+        return None
+
+    for pattern, rule in compiled_rules:
+        if pattern.search(desc_lower):
+            return rule
 
     return None
 
@@ -376,17 +426,8 @@ def get_matching_rule(description: str) -> Optional[str]:
     if not description:
         return None
 
-    desc_lower = description.lower().strip()
-    desc_lower = ' '.join(desc_lower.split())
-
-    for pattern, category, subcategory in CATEGORY_RULES:
-        try:
-            if re.search(pattern, desc_lower, re.IGNORECASE):
-                return pattern
-        except re.error:
-            continue
-
-    return None
+    rule = _first_matching_rule(description)
+    return rule[0] if rule is not None else None
 
 
 def test_rules():
@@ -287,8 +287,8 @@ def main() -> int:
     transactions: List[Transaction] = []
 
     if file_type == 'xlsx':
-        parser = XLSXParser(args.input, sheet_name=args.sheet)
-        transactions = parser.parse()
+        with XLSXParser(args.input, sheet_name=args.sheet) as parser:
+            transactions = parser.parse()
     else:
         parser = CSVParser(
             args.input,
@@ -380,42 +380,42 @@ def _process_pdf(args) -> int:
             print(f"Error: Invalid page range '{args.page_range}'. Use format: 170-190")
             return 1
 
-    pdf_parser = PDFPnLParser(
+    with PDFPnLParser(
         args.input,
         page_range=page_range,
-    )
-
-    # Step 1: Identify or use specific page
-    if args.pnl_page:
-        print(f"\nExtracting P&L from page {args.pnl_page} (skipping identification)")
-        try:
-            line_items = pdf_parser.extract_from_specific_page(args.pnl_page)
-        except (ExtractionError, ValueError) as e:
-            print(f"Error: {e}")
-            return 1
-    else:
-        print("\nStep 1: Identifying P&L pages...")
-        pnl_pages = pdf_parser.identify_pnl_pages()
-
-        if not pnl_pages:
-            print("Error: Could not identify any pages containing P&L data.")
-            print("Tips:")
-            print("  - Use --page-range to narrow the search (e.g. --page-range 170-190)")
-            print("  - Use --pnl-page to specify the exact page number")
-            print("  - Ensure the PDF contains extractable text (not a scanned image)")
-            return 1
-
-        print(f"\nFound P&L data on {len(pnl_pages)} page(s):")
-        for pm in pnl_pages:
-            print(f"  Page {pm.page_number} (score: {pm.score:.1f}) - matched: {', '.join(pm.matched_keywords[:5])}")
-
-        # Step 2: Extract line items
-        print("\nStep 2: Extracting P&L line items...")
-        try:
-            line_items = pdf_parser.extract_all()
-        except ExtractionError as e:
-            print(f"Error: {e}")
-            return 1
+        max_workers=os.cpu_count(),
+    ) as pdf_parser:
+        # Step 1: Identify or use specific page
+        if args.pnl_page:
+            print(f"\nExtracting P&L from page {args.pnl_page} (skipping identification)")
+            try:
+                line_items = pdf_parser.extract_from_specific_page(args.pnl_page)
+            except (ExtractionError, ValueError) as e:
+                print(f"Error: {e}")
+                return 1
+        else:
+            print("\nStep 1: Identifying P&L pages...")
+            pnl_pages = pdf_parser.identify_pnl_pages()
+
+            if not pnl_pages:
+                print("Error: Could not identify any pages containing P&L data.")
+                print("Tips:")
+                print("  - Use --page-range to narrow the search (e.g. --page-range 170-190)")
+                print("  - Use --pnl-page to specify the exact page number")
+                print("  - Ensure the PDF contains extractable text (not a scanned image)")
+                return 1
+
+            print(f"\nFound P&L data on {len(pnl_pages)} page(s):")
+            for pm in pnl_pages:
+                print(f"  Page {pm.page_number} (score: {pm.score:.1f}) - matched: {', '.join(pm.matched_keywords[:5])}")
+
+            # Step 2: Extract line items
+            print("\nStep 2: Extracting P&L line items...")
+            try:
+                line_items = pdf_parser.extract_all()
+            except ExtractionError as e:
+                print(f"Error: {e}")
+                return 1
 
     if not line_items:
         print("Error: No line items extracted")
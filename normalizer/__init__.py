@@ -1,7 +1,10 @@
 """
 Normalizer module for parsing dates and amounts.
 """
-from .date_parser import parse_date, is_valid_date
-from .amount_parser import parse_amount, has_valid_amount
+from .date_parser import parse_date, parse_date_series, is_valid_date
+from .amount_parser import parse_amount, parse_amount_series, has_valid_amount
 
-__all__ = ['parse_date', 'is_valid_date', 'parse_amount', 'has_valid_amount']
+__all__ = [
+    'parse_date', 'parse_date_series', 'is_valid_date',
+    'parse_amount', 'parse_amount_series', 'has_valid_amount',
+]
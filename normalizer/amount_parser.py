@@ -4,6 +4,31 @@ Amount parser for handling Indian number formats and currency.
 import re
 from typing import Optional, Tuple, Union
 
+import numpy as np
+import pandas as pd
+
+# Currency symbols and prefixes, fused into a single pattern so each value
+# is scanned once instead of once per symbol
+_CURRENCY_PATTERNS = [
+    r'₹\s*',           # Rupee symbol
+    r'Rs\.?\s*',       # Rs or Rs.
+    r'INR\s*',         # INR
+    r'USD\s*',         # USD
+    r'\$\s*',          # Dollar
+    r'€\s*',           # Euro
+    r'£\s*',           # Pound
+]
+_CURRENCY_RE = re.compile('|'.join(_CURRENCY_PATTERNS), re.IGNORECASE)
+
+# DR/CR sign suffixes
+_DR_SUFFIX_RE = re.compile(r'\s*(DR|Dr|dr)\s*$')
+_CR_SUFFIX_RE = re.compile(r'\s*(CR|Cr|cr)\s*$')
+_SIGN_SUFFIX_RE = re.compile(r'(DR|CR|Dr|Cr|dr|cr)\s*$')
+
+# Plain figures such as "1,23,456.78" or "-500" that parse_amount reduces to
+# float() after dropping commas; anything else takes the scalar path
+_PLAIN_AMOUNT_PATTERN = r'^\s*-?[0-9][0-9,]*(?:\.[0-9]+)?\s*$'
+
 
 def parse_amount(value: Union[str, int, float, None]) -> float:
     """
@@ -34,11 +59,58 @@ def parse_amount(value: Union[str, int, float, None]) -> float:
     if not value_str:
         return 0.0
 
+    # Clean figures like "1000.50" or "-250" need none of the normalization
+    # below, which would arrive at the same float() call. Grouped figures
+    # and DR/CR suffixes skip the attempt rather than pay for the exception.
+    if value_str[-1].isdigit() and ',' not in value_str:
+        try:
+            return float(value_str)
+        except ValueError:
+            pass
+
     # Parse the amount
     amount, _ = _parse_amount_with_sign(value_str)
     return amount
 
 
+def parse_amount_series(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of amounts in bulk.
+
+    Plain figures are converted in one vectorized pass; cells with currency
+    symbols, DR/CR suffixes, parentheses and the like fall back to
+    parse_amount, so every value matches the scalar parser.
+
+    Args:
+        values: A Series of raw amount cells
+
+    Returns:
+        A float Series aligned with values, NaN wherever the cell is missing
+        or has_valid_amount rejects it
+    """
+    result = np.full(len(values), np.nan)
+    present = values.notna().to_numpy()
+
+    if present.any():
+        text = values[present].astype(str)
+        plain = text.str.match(_PLAIN_AMOUNT_PATTERN).to_numpy(dtype=bool)
+
+        parsed = np.empty(len(text))
+        # Object-to-float casting goes through float() per cell, keeping
+        # the exact rounding of the scalar parser
+        parsed[plain] = (
+            text[plain].str.replace(',', '', regex=False).str.strip()
+            .to_numpy(dtype=object).astype(np.float64)
+        )
+        parsed[~plain] = [
+            parse_amount(v) if has_valid_amount(v) else np.nan
+            for v in values[present][~plain].tolist()
+        ]
+        result[present] = parsed
+
+    return pd.Series(result, index=values.index)
+
+
 def _parse_amount_with_sign(value_str: str) -> Tuple[float, str]:
     """
     Parse an amount string and determine its sign.
@@ -57,8 +129,8 @@ def _parse_amount_with_sign(value_str: str) -> Tuple[float, str]:
     sign_indicator = ""
 
     # Check for DR/CR suffix (case-insensitive)
-    dr_match = re.search(r'\s*(DR|Dr|dr)\s*$', value_str)
-    cr_match = re.search(r'\s*(CR|Cr|cr)\s*$', value_str)
+    dr_match = _DR_SUFFIX_RE.search(value_str)
+    cr_match = _CR_SUFFIX_RE.search(value_str)
 
     if dr_match:
         is_negative = True
@@ -121,21 +193,7 @@ def _remove_currency_symbols(value_str: str) -> str:
     Returns:
         String with currency symbols removed
     """
-    # Remove common currency symbols and prefixes
-    patterns = [
-        r'₹\s*',           # Rupee symbol
-        r'Rs\.?\s*',       # Rs or Rs.
-        r'INR\s*',         # INR
-        r'USD\s*',         # USD
-        r'\$\s*',          # Dollar
-        r'€\s*',           # Euro
-        r'£\s*',           # Pound
-    ]
-
-    for pattern in patterns:
-        value_str = re.sub(pattern, '', value_str, flags=re.IGNORECASE)
-
-    return value_str
+    return _CURRENCY_RE.sub('', value_str)
 
 
 def has_valid_amount(value: Union[str, int, float, None]) -> bool:
@@ -161,7 +219,7 @@ def has_valid_amount(value: Union[str, int, float, None]) -> bool:
 
     # Remove known non-numeric parts
     cleaned = _remove_currency_symbols(value_str)
-    cleaned = re.sub(r'(DR|CR|Dr|Cr|dr|cr)\s*$', '', cleaned)
+    cleaned = _SIGN_SUFFIX_RE.sub('', cleaned)
     cleaned = cleaned.strip()
 
     # Remove parentheses
@@ -3,11 +3,73 @@ Date parser for handling multiple Indian date formats.
 """
 import re
 from datetime import date, datetime
-from typing import Optional, Union
+from typing import Dict, List, Optional, Pattern, Tuple, Union
+
+import numpy as np
+import pandas as pd
 
 from config import DATE_FORMATS
 
 
+# What each strptime directive in DATE_FORMATS can consume. \d and the
+# letter class are Unicode-aware on purpose: strptime accepts any decimal
+# digit and folds month names case-insensitively.
+_DIRECTIVE_SHAPES: Dict[str, str] = {
+    'd': r'\d+',
+    'm': r'\d+',
+    'y': r'\d+',
+    'Y': r'\d+',
+    'b': r'[^\W\d_]+',
+    'B': r'[^\W\d_]+',
+}
+
+
+def _format_shape(fmt: str) -> Optional[str]:
+    """
+    Build a regex for the token layout a strptime format can match.
+
+    Returns None if the format uses a directive without a known shape.
+    """
+    parts = []
+    for i, piece in enumerate(re.split(r'(%.)', fmt)):
+        if i % 2:
+            shape = _DIRECTIVE_SHAPES.get(piece[1])
+            if shape is None:
+                return None
+            parts.append(shape)
+        else:
+            # strptime lets any whitespace run stand in for a format space
+            parts.append(r'\s+'.join(re.escape(p) for p in re.split(r'\s+', piece)))
+    return ''.join(parts)
+
+
+def _index_date_formats(
+    formats: List[str]
+) -> Tuple[Pattern, Dict[str, Tuple[str, ...]], Tuple[str, ...]]:
+    """
+    Group date formats by the layout of the strings they accept.
+
+    Returns one union regex with a named group per layout, the formats
+    worth trying for each group (in their original order), and the formats
+    to try when no layout matches.
+    """
+    shapes = {fmt: _format_shape(fmt) for fmt in formats}
+    layouts = list(dict.fromkeys(s for s in shapes.values() if s is not None))
+
+    candidates = {
+        f'f{i}': tuple(fmt for fmt in formats if shapes[fmt] in (layout, None))
+        for i, layout in enumerate(layouts)
+    }
+    unmatched = tuple(fmt for fmt in formats if shapes[fmt] is None)
+    union = '|'.join(f'(?P<f{i}>{layout})' for i, layout in enumerate(layouts))
+    return re.compile(union or '(?!)'), candidates, unmatched
+
+
+# A string can only satisfy formats with its layout ("N/N/N", "N A N", ...),
+# so one fullmatch picks those instead of raising through every format
+_DATE_LAYOUT_RE, _FORMATS_BY_LAYOUT, _FORMATS_ANY_LAYOUT = _index_date_formats(DATE_FORMATS)
+
+
 def parse_date(value: Union[str, datetime, date, None]) -> Optional[date]:
     """
     Parse a date value from various formats into a Python date object.
@@ -36,8 +98,15 @@ def parse_date(value: Union[str, datetime, date, None]) -> Optional[date]:
     # Normalize the string
     value_str = _normalize_date_string(value_str)
 
-    # Try each date format in order
-    for fmt in DATE_FORMATS:
+    # Fixed-width numeric dates skip strptime entirely
+    parsed_date = _parse_fixed_width_date(value_str)
+    if parsed_date is not None:
+        return parsed_date
+
+    # Try each date format with a matching layout, in order
+    layout = _DATE_LAYOUT_RE.fullmatch(value_str)
+    formats = _FORMATS_BY_LAYOUT[layout.lastgroup] if layout else _FORMATS_ANY_LAYOUT
+    for fmt in formats:
         try:
             parsed = datetime.strptime(value_str, fmt)
             return parsed.date()
@@ -56,6 +125,54 @@ def parse_date(value: Union[str, datetime, date, None]) -> Optional[date]:
     return None
 
 
+def parse_date_series(values: pd.Series) -> pd.Series:
+    """
+    Parse a column of date values in bulk.
+
+    Statements repeat the same few dates across many rows, so each distinct
+    value is parsed once with parse_date and the results are broadcast back.
+
+    Args:
+        values: A Series of raw date cells (strings or date objects)
+
+    Returns:
+        An object Series aligned with values, holding a date or None
+    """
+    codes, uniques = pd.factorize(values)
+    # Code -1 marks missing cells; it indexes the trailing None
+    parsed = np.empty(len(uniques) + 1, dtype=object)
+    parsed[:-1] = [parse_date(v) for v in uniques]
+    return pd.Series(parsed[codes], index=values.index, dtype=object)
+
+
+def _parse_fixed_width_date(value: str) -> Optional[date]:
+    """
+    Parse "DD/MM/YYYY", "DD-MM-YYYY" or "YYYY-MM-DD" by slicing.
+
+    These are the first DATE_FORMATS entries for their layouts (a 4-digit
+    year can't pass as %d), so a valid result here is what strptime would
+    return. Anything else, including impossible dates, returns None and is
+    left to the format loop.
+    """
+    if len(value) != 10 or not value.isascii():
+        return None
+
+    if value[2] == value[5] and value[2] in '/-':
+        day, month, year = value[:2], value[3:5], value[6:]
+    elif value[4] == value[7] == '-':
+        year, month, day = value[:4], value[5:7], value[8:]
+    else:
+        return None
+
+    if not (day.isdigit() and month.isdigit() and year.isdigit()):
+        return None
+
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
 def _normalize_date_string(value: str) -> str:
     """
     Normalize a date string by cleaning up whitespace and separators.
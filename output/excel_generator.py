@@ -10,6 +10,7 @@ Creates a formatted Excel workbook with multiple sheets:
 6. Statistics
 """
 from collections import defaultdict
+from copy import copy
 from datetime import date
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -41,6 +42,41 @@ DATE_FORMAT = 'DD-MMM-YYYY'
 PERCENT_FORMAT = '0.00%'
 
 
+class _StyleCache:
+    """
+    Reuse resolved cell styles across a sheet's data rows.
+
+    Assigning number_format or fill through openpyxl hashes the style
+    objects and looks them up in the workbook on every cell. Data rows only
+    use a handful of (format, fill) combinations, so each is resolved once
+    and copied onto later cells.
+    """
+
+    def __init__(self):
+        self._styles: Dict[Tuple[Optional[str], int], Any] = {}
+
+    def apply(
+        self,
+        cell,
+        number_format: Optional[str] = None,
+        fill: Optional[PatternFill] = None
+    ) -> None:
+        """Give a cell the number format and fill (module-level styles)."""
+        if number_format is None and fill is None:
+            return
+
+        key = (number_format, id(fill))
+        style = self._styles.get(key)
+        if style is None:
+            if number_format is not None:
+                cell.number_format = number_format
+            if fill is not None:
+                cell.fill = fill
+            self._styles[key] = copy(cell._style)
+        else:
+            cell._style = copy(style)
+
+
 def generate_output_excel(
     transactions: List[Transaction],
     output_path: str,
@@ -156,53 +192,51 @@ def _create_reconciliation_sheet(wb: Workbook, transactions: List[Transaction])
         cell.alignment = Alignment(horizontal='center')
 
     # Write transaction data (starting row 12)
+    styles = _StyleCache()
     data_start_row = data_header_row + 1
     for row_idx, result in enumerate(results, data_start_row):
         txn = result.transaction
 
+        # Highlight mismatched rows in red, shade alternate matching rows
+        if result.is_mismatch:
+            fill = MISMATCH_FILL
+        elif row_idx % 2 == 0:
+            fill = ALT_ROW_FILL
+        else:
+            fill = None
+
         # Date
         cell = ws.cell(row=row_idx, column=1, value=txn.date)
-        cell.number_format = DATE_FORMAT
+        styles.apply(cell, DATE_FORMAT, fill)
 
         # Description
-        ws.cell(row=row_idx, column=2, value=txn.description[:50] if txn.description else "")
+        cell = ws.cell(row=row_idx, column=2, value=txn.description[:50] if txn.description else "")
+        styles.apply(cell, None, fill)
 
         # Debit
         cell = ws.cell(row=row_idx, column=3, value=txn.debit)
-        if txn.debit:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.debit else None, fill)
 
         # Credit
         cell = ws.cell(row=row_idx, column=4, value=txn.credit)
-        if txn.credit:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.credit else None, fill)
 
         # Displayed Balance (from statement)
         cell = ws.cell(row=row_idx, column=5, value=txn.balance)
-        if txn.balance:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.balance else None, fill)
 
         # Calculated Balance
         cell = ws.cell(row=row_idx, column=6, value=result.calculated_balance)
-        cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT, fill)
 
         # Difference
         cell = ws.cell(row=row_idx, column=7, value=result.balance_difference)
-        if result.balance_difference:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if result.balance_difference else None, fill)
 
         # Status
-        if result.is_mismatch:
-            ws.cell(row=row_idx, column=8, value="⚠ MISMATCH")
-            # Highlight entire row in red
-            for col in range(1, 9):
-                ws.cell(row=row_idx, column=col).fill = MISMATCH_FILL
-        else:
-            ws.cell(row=row_idx, column=8, value="✓ OK")
-            # Light green for matching rows
-            if row_idx % 2 == 0:
-                for col in range(1, 9):
-                    ws.cell(row=row_idx, column=col).fill = ALT_ROW_FILL
+        status_text = "⚠ MISMATCH" if result.is_mismatch else "✓ OK"
+        cell = ws.cell(row=row_idx, column=8, value=status_text)
+        styles.apply(cell, None, fill)
 
     # Column widths
     column_widths = [12, 50, 15, 15, 18, 18, 15, 15]
@@ -237,59 +271,61 @@ def _create_all_transactions_sheet(
         cell.alignment = Alignment(horizontal='center')
 
     # Write data rows
+    styles = _StyleCache()
     for row_idx, txn in enumerate(transactions, 2):
+        # Highlight flagged rows, alternate row colors for the rest
+        if txn.categorization_source == "flagged":
+            fill = FLAGGED_FILL
+        elif row_idx % 2 == 0:
+            fill = ALT_ROW_FILL
+        else:
+            fill = None
+
         # Date
         cell = ws.cell(row=row_idx, column=1, value=txn.date)
-        cell.number_format = DATE_FORMAT
+        styles.apply(cell, DATE_FORMAT, fill)
 
         # Description
-        ws.cell(row=row_idx, column=2, value=txn.description)
+        cell = ws.cell(row=row_idx, column=2, value=txn.description)
+        styles.apply(cell, None, fill)
 
         # Debit
         cell = ws.cell(row=row_idx, column=3, value=txn.debit)
-        if txn.debit:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.debit else None, fill)
 
         # Credit
         cell = ws.cell(row=row_idx, column=4, value=txn.credit)
-        if txn.credit:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.credit else None, fill)
 
         # Balance
         cell = ws.cell(row=row_idx, column=5, value=txn.balance)
-        if txn.balance:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.balance else None, fill)
 
         # Category
-        ws.cell(row=row_idx, column=6, value=txn.category)
+        cell = ws.cell(row=row_idx, column=6, value=txn.category)
+        styles.apply(cell, None, fill)
 
         # Subcategory
-        ws.cell(row=row_idx, column=7, value=txn.subcategory)
+        cell = ws.cell(row=row_idx, column=7, value=txn.subcategory)
+        styles.apply(cell, None, fill)
 
         # Confidence
         cell = ws.cell(row=row_idx, column=8, value=txn.categorization_confidence)
-        cell.number_format = PERCENT_FORMAT
+        styles.apply(cell, PERCENT_FORMAT, fill)
 
         # Source
-        ws.cell(row=row_idx, column=9, value=txn.categorization_source)
+        cell = ws.cell(row=row_idx, column=9, value=txn.categorization_source)
+        styles.apply(cell, None, fill)
 
         # Notes (Haiku suggestion for flagged items)
         notes = txn.haiku_suggestion if txn.categorization_source == "flagged" else ""
-        ws.cell(row=row_idx, column=10, value=notes)
+        cell = ws.cell(row=row_idx, column=10, value=notes)
+        styles.apply(cell, None, fill)
 
         # Raw text (optional)
         if include_raw_text:
-            ws.cell(row=row_idx, column=11, value=txn.raw_text)
-
-        # Highlight flagged rows
-        if txn.categorization_source == "flagged":
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).fill = FLAGGED_FILL
-
-        # Alternate row colors (for non-flagged)
-        elif row_idx % 2 == 0:
-            for col in range(1, len(headers) + 1):
-                ws.cell(row=row_idx, column=col).fill = ALT_ROW_FILL
+            cell = ws.cell(row=row_idx, column=11, value=txn.raw_text)
+            styles.apply(cell, None, fill)
 
     # Set column widths
     column_widths = [12, 50, 15, 15, 15, 20, 25, 12, 10, 40]
@@ -491,34 +527,31 @@ def _create_flagged_sheet(wb: Workbook, transactions: List[Transaction]) -> None
         cell.font = HEADER_FONT
         cell.fill = HEADER_FILL
 
-    # Write data
+    # Write data (yellow background for flagged)
+    styles = _StyleCache()
     for row_idx, txn in enumerate(flagged, 2):
         cell = ws.cell(row=row_idx, column=1, value=txn.date)
-        cell.number_format = DATE_FORMAT
+        styles.apply(cell, DATE_FORMAT, FLAGGED_FILL)
 
-        ws.cell(row=row_idx, column=2, value=txn.description)
+        cell = ws.cell(row=row_idx, column=2, value=txn.description)
+        styles.apply(cell, None, FLAGGED_FILL)
 
         cell = ws.cell(row=row_idx, column=3, value=txn.debit)
-        if txn.debit:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.debit else None, FLAGGED_FILL)
 
         cell = ws.cell(row=row_idx, column=4, value=txn.credit)
-        if txn.credit:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.credit else None, FLAGGED_FILL)
 
         cell = ws.cell(row=row_idx, column=5, value=txn.balance)
-        if txn.balance:
-            cell.number_format = CURRENCY_FORMAT
+        styles.apply(cell, CURRENCY_FORMAT if txn.balance else None, FLAGGED_FILL)
 
-        ws.cell(row=row_idx, column=6, value=txn.haiku_suggestion)
+        cell = ws.cell(row=row_idx, column=6, value=txn.haiku_suggestion)
+        styles.apply(cell, None, FLAGGED_FILL)
 
         # Empty columns for user to fill
-        ws.cell(row=row_idx, column=7, value="")
-        ws.cell(row=row_idx, column=8, value="")
-
-        # Yellow background for flagged
-        for col in range(1, 9):
-            ws.cell(row=row_idx, column=col).fill = FLAGGED_FILL
+        for col in (7, 8):
+            cell = ws.cell(row=row_idx, column=col, value="")
+            styles.apply(cell, None, FLAGGED_FILL)
 
     # Column widths
     for col, width in enumerate([12, 50, 15, 15, 15, 40, 20, 25], 1):
@@ -376,6 +376,10 @@ class BankProfileManager:
         self.profiles = {p.name: p for p in ALL_PROFILES}
         self.generic_profile = GENERIC_PROFILE
 
+        # id(profile) -> (profile, fused skip pattern, fused page pattern);
+        # should_skip_row runs on every statement row
+        self._skip_matchers: Dict[int, Tuple[BankProfile, Pattern, Pattern]] = {}
+
     def get_profile(self, bank_name: str) -> BankProfile:
         """
         Get a bank profile by name or alias.
@@ -486,30 +490,52 @@ class BankProfileManager:
         patterns = profile.row_patterns.skip_patterns or []
         return list(set(patterns + DEFAULT_SKIP_PATTERNS))
 
-    def should_skip_row(self, row: List[str], profile: BankProfile) -> bool:
+    def _get_skip_matchers(self, profile: BankProfile) -> Tuple[Pattern, Pattern]:
+        """
+        Get the compiled skip and page patterns for a profile.
+
+        Skip patterns are plain substrings, so they are escaped and fused
+        into one case-sensitive alternation over the lowercased row text.
+        Page patterns are regexes and keep their IGNORECASE matching.
+        """
+        cached = self._skip_matchers.get(id(profile))
+        if cached is not None and cached[0] is profile:
+            return cached[1], cached[2]
+
+        skip_re = re.compile('|'.join(
+            re.escape(pattern.lower()) for pattern in self.get_skip_patterns(profile)
+        ) or '(?!)')
+        page_re = re.compile('|'.join(
+            f'(?:{pattern})' for pattern in (profile.row_patterns.page_patterns or [])
+        ) or '(?!)', re.IGNORECASE)
+
+        self._skip_matchers[id(profile)] = (profile, skip_re, page_re)
+        return skip_re, page_re
+
+    def should_skip_row(
+        self,
+        row: List[str],
+        profile: BankProfile,
+        row_text: Optional[str] = None
+    ) -> bool:
         """
         Check if a row should be skipped based on profile patterns.
 
         Args:
             row: Row data
             profile: Bank profile
+            row_text: Pre-joined lowercase row text, if already computed
 
         Returns:
             True if row should be skipped
         """
-        row_text = " ".join(str(c).lower() for c in row if str(c).strip())
-
-        # Check skip patterns
-        for pattern in self.get_skip_patterns(profile):
-            if pattern.lower() in row_text:
-                return True
+        if row_text is None:
+            row_text = " ".join(str(c).lower() for c in row if str(c).strip())
 
-        # Check page patterns
-        for page_pattern in (profile.row_patterns.page_patterns or []):
-            if re.search(page_pattern, row_text, re.IGNORECASE):
-                return True
+        skip_re, page_re = self._get_skip_matchers(profile)
 
-        return False
+        # Check skip patterns, then page patterns
+        return bool(skip_re.search(row_text) or page_re.search(row_text))
 
     def is_transaction_start(
         self,
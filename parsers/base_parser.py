@@ -7,10 +7,12 @@ from datetime import date
 from typing import Any, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     Represents a normalized bank transaction.
+
+    Uses __slots__ since one instance is created per statement row.
     """
     date: Optional[date]
     description: str
@@ -109,6 +111,15 @@ class BaseParser(ABC):
         self._transactions: List[Transaction] = []
         self._validation_issues: List[ValidationIssue] = []
 
+    def __enter__(self) -> "BaseParser":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release any file handles held by the parser."""
+
     @abstractmethod
     def parse(self) -> List[Transaction]:
         """
@@ -8,11 +8,15 @@ Handles:
 - Garbage rows
 - Multiple bank formats via bank profiles
 """
+import codecs
 import csv
+import io
+import itertools
 import os
 import re
-from typing import Any, Dict, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
 from config import (
@@ -26,8 +30,10 @@ from config import (
     SKIP_ROW_KEYWORDS,
     get_config,
 )
-from normalizer.amount_parser import parse_amount, has_valid_amount, parse_debit_credit
-from normalizer.date_parser import parse_date, is_valid_date
+from normalizer.amount_parser import (
+    parse_amount, parse_amount_series, has_valid_amount, parse_debit_credit
+)
+from normalizer.date_parser import parse_date, parse_date_series, is_valid_date
 from parsers.base_parser import BaseParser, Transaction, ValidationIssue
 
 # Import bank profiles for flexible parsing
@@ -45,6 +51,75 @@ except ImportError:
     GENERIC_PROFILE = None
 
 
+def _compile_column_keywords(keywords: List[str]) -> re.Pattern:
+    """
+    Compile a column keyword list into a single alternation.
+
+    Short keywords (1-2 chars) must be bounded by non-alpha characters,
+    mirroring CSVParser._matches_keywords.
+    """
+    parts = []
+    for keyword in keywords:
+        if len(keyword) <= 2:
+            parts.append(r'(?:^|[^a-z])' + re.escape(keyword) + r'(?:[^a-z]|$)')
+        else:
+            parts.append(re.escape(keyword))
+    return re.compile('|'.join(parts))
+
+
+# Column roles in priority order, each with its precompiled keyword pattern
+_COLUMN_ROLE_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ('date', _compile_column_keywords(DATE_COLUMN_KEYWORDS)),
+    ('description', _compile_column_keywords(DESCRIPTION_COLUMN_KEYWORDS)),
+    ('debit', _compile_column_keywords(DEBIT_COLUMN_KEYWORDS)),
+    ('credit', _compile_column_keywords(CREDIT_COLUMN_KEYWORDS)),
+    ('balance', _compile_column_keywords(BALANCE_COLUMN_KEYWORDS)),
+]
+
+
+# Page markers, "continued" rows and footers, fused so a row is scanned once
+_GARBAGE_ROW_RE = re.compile(
+    r'^page\s*\d+'
+    r'|page\s+\d+\s+of\s+\d+'
+    r'|page\s+\d+[-/]\d+'
+    r'|^\d+\s+of\s+\d+$'  # "1 of 5"
+    r'|continued|contd'
+    r'|disclaimer|terms and conditions|this is a computer generated'
+)
+
+
+def _read_rows(text: str, max_rows: Optional[int] = None) -> List[List[str]]:
+    """
+    Split decoded CSV text into rows.
+
+    When the text has no quote characters at all, the csv module can skip
+    quote-state tracking entirely. The whole text is checked (not a sample)
+    since quoted amounts like "1,23,456.00" may first appear deep into the
+    file.
+    """
+    quoting = csv.QUOTE_MINIMAL if '"' in text else csv.QUOTE_NONE
+    reader = csv.reader(io.StringIO(text, newline=''), quoting=quoting)
+    return list(itertools.islice(reader, max_rows))
+
+
+def _decode_lines(raw_lines: Iterator[bytes], encoding: str) -> Iterator[str]:
+    """
+    Lazily decode raw lines with one encoding.
+
+    An incremental decoder keeps a BOM or a character split across lines
+    from being decoded on its own; a truncated sequence at the end of the
+    stream still raises UnicodeDecodeError.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    for raw in raw_lines:
+        text = decoder.decode(raw)
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
 class CSVParser(BaseParser):
     """
     Parser for CSV bank statement files (typically from Docling PDF conversion).
@@ -58,7 +133,7 @@ class CSVParser(BaseParser):
 
     def __init__(
         self,
-        filepath: str,
+        filepath: Union[str, IO],
         date_col: Optional[int] = None,
         desc_cols: Optional[List[int]] = None,
         debit_col: Optional[int] = None,
@@ -72,7 +147,7 @@ class CSVParser(BaseParser):
         Initialize the CSV parser.
 
         Args:
-            filepath: Path to the CSV file
+            filepath: Path to the CSV file, or an open text/binary file object
             date_col: Column index for date (0-based)
             desc_cols: Column indices for description (can be multiple)
             debit_col: Column index for debit amount
@@ -92,6 +167,7 @@ class CSVParser(BaseParser):
 
         self._encoding: Optional[str] = None
         self._detected_columns: Dict[str, int] = {}
+        self._preview_cache: Optional[List[List[str]]] = None
 
         # Docling format support
         self._is_docling_format: bool = False
@@ -116,7 +192,7 @@ class CSVParser(BaseParser):
         Returns:
             List of Transaction objects
         """
-        print(f"Parsing CSV file: {self.filepath}")
+        print(f"Parsing CSV file: {self._source_name}")
 
         # Read the file with encoding detection
         rows = self._read_csv()
@@ -127,11 +203,14 @@ class CSVParser(BaseParser):
 
         print(f"Read {len(rows)} rows from CSV")
 
+        # Keep the leading rows around so preview_rows() doesn't re-read the file
+        self._preview_cache = rows[:20]
+
         # Auto-detect bank profile if enabled and not already set
         if _HAS_BANK_PROFILES and self._auto_detect_bank and self._bank_profile is None:
             self._bank_profile = detect_bank(
                 rows=rows,
-                filename=os.path.basename(self.filepath)
+                filename=os.path.basename(self._source_name)
             )
             print(f"Auto-detected bank profile: {self._bank_profile.name}")
 
@@ -145,18 +224,33 @@ class CSVParser(BaseParser):
 
         return self._transactions
 
-    def _read_csv(self) -> List[List[str]]:
+    @property
+    def _source_name(self) -> str:
+        """File name for messages and bank detection ('' for unnamed streams)."""
+        if hasattr(self.filepath, 'read'):
+            return str(getattr(self.filepath, 'name', ''))
+        return os.fspath(self.filepath)
+
+    def _read_csv(self, max_rows: Optional[int] = None) -> List[List[str]]:
         """
         Read CSV file with encoding fallback.
 
+        Args:
+            max_rows: Stop after this many rows (reads the whole file if None)
+
         Returns:
             List of rows (each row is a list of strings)
         """
+        if hasattr(self.filepath, 'read'):
+            return self._read_csv_stream(max_rows)
+
         for encoding in FILE_ENCODINGS:
             try:
-                with open(self.filepath, 'r', encoding=encoding) as f:
-                    reader = csv.reader(f)
-                    rows = list(reader)
+                with open(self.filepath, 'r', encoding=encoding, newline='') as f:
+                    if max_rows is None:
+                        rows = _read_rows(f.read())
+                    else:
+                        rows = list(itertools.islice(csv.reader(f), max_rows))
                     self._encoding = encoding
                     print(f"Successfully read CSV with encoding: {encoding}")
                     return rows
@@ -169,6 +263,52 @@ class CSVParser(BaseParser):
         print("Failed to read CSV with any supported encoding")
         return []
 
+    def _read_csv_stream(self, max_rows: Optional[int] = None) -> List[List[str]]:
+        """
+        Read CSV rows from a file object (text or bytes).
+
+        Bytes are decoded with the same encoding fallback as files on disk.
+        Only the lines needed for ``max_rows`` rows are read, and the stream
+        is rewound first only when it is seekable, so non-seekable uploads
+        can still be parsed once.
+        """
+        stream = self.filepath
+        if stream.seekable():
+            stream.seek(0)
+
+        if isinstance(stream.read(0), str):
+            self._encoding = getattr(stream, 'encoding', None)
+            if max_rows is None:
+                return _read_rows(stream.read())
+            return list(itertools.islice(csv.reader(stream), max_rows))
+
+        # Keep the raw lines read so far so a failed decode can be retried
+        # with the next encoding without re-reading the stream
+        seen: List[bytes] = []
+        remaining = iter(stream)
+
+        def raw_lines():
+            yield from seen
+            for line in remaining:
+                seen.append(line)
+                yield line
+
+        for encoding in FILE_ENCODINGS:
+            lines = _decode_lines(raw_lines(), encoding)
+            try:
+                if max_rows is None:
+                    rows = _read_rows(''.join(lines))
+                else:
+                    rows = list(itertools.islice(csv.reader(lines), max_rows))
+            except UnicodeDecodeError:
+                continue
+            self._encoding = encoding
+            print(f"Successfully read CSV with encoding: {encoding}")
+            return rows
+
+        print("Failed to read CSV with any supported encoding")
+        return []
+
     def _auto_detect_columns(self, rows: List[List[str]]) -> None:
         """
         Auto-detect column mappings from the CSV.
@@ -204,44 +344,25 @@ class CSVParser(BaseParser):
         # Track which columns have been assigned
         used_cols = set()
 
-        # Map columns - order matters for priority
+        # Map columns - each column is classified once against the roles
+        # that are still unassigned (order matters for priority)
         for col_idx, col_name in enumerate(header_row):
             col_lower = str(col_name).strip().lower()
+            role = self._classify_column(col_lower)
+            if role is None:
+                continue
 
-            # Check for date column
-            if self.date_col is None and col_idx not in used_cols:
-                if self._matches_keywords(col_lower, DATE_COLUMN_KEYWORDS):
-                    self.date_col = col_idx
-                    used_cols.add(col_idx)
-                    continue
-
-            # Check for description column
-            if not self.desc_cols and col_idx not in used_cols:
-                if self._matches_keywords(col_lower, DESCRIPTION_COLUMN_KEYWORDS):
-                    self.desc_cols = [col_idx]
-                    used_cols.add(col_idx)
-                    continue
-
-            # Check for debit column
-            if self.debit_col is None and col_idx not in used_cols:
-                if self._matches_keywords(col_lower, DEBIT_COLUMN_KEYWORDS):
-                    self.debit_col = col_idx
-                    used_cols.add(col_idx)
-                    continue
-
-            # Check for credit column
-            if self.credit_col is None and col_idx not in used_cols:
-                if self._matches_keywords(col_lower, CREDIT_COLUMN_KEYWORDS):
-                    self.credit_col = col_idx
-                    used_cols.add(col_idx)
-                    continue
-
-            # Check for balance column
-            if self.balance_col is None and col_idx not in used_cols:
-                if self._matches_keywords(col_lower, BALANCE_COLUMN_KEYWORDS):
-                    self.balance_col = col_idx
-                    used_cols.add(col_idx)
-                    continue
+            used_cols.add(col_idx)
+            if role == 'date':
+                self.date_col = col_idx
+            elif role == 'description':
+                self.desc_cols = [col_idx]
+            elif role == 'debit':
+                self.debit_col = col_idx
+            elif role == 'credit':
+                self.credit_col = col_idx
+            elif role == 'balance':
+                self.balance_col = col_idx
 
         # If no separate debit/credit, look for single amount column
         if self.debit_col is None and self.credit_col is None:
@@ -258,6 +379,28 @@ class CSVParser(BaseParser):
               f"credit: {self.credit_col}, amount: {self.amount_col}, "
               f"balance: {self.balance_col}")
 
+    def _classify_column(self, col_lower: str) -> Optional[str]:
+        """
+        Classify a header cell into the first still-unassigned column role.
+
+        Args:
+            col_lower: Lowercase column name
+
+        Returns:
+            'date', 'description', 'debit', 'credit', 'balance', or None
+        """
+        unassigned = {
+            'date': self.date_col is None,
+            'description': not self.desc_cols,
+            'debit': self.debit_col is None,
+            'credit': self.credit_col is None,
+            'balance': self.balance_col is None,
+        }
+        for role, pattern in _COLUMN_ROLE_PATTERNS:
+            if unassigned[role] and pattern.search(col_lower):
+                return role
+        return None
+
     def _matches_keywords(self, col_lower: str, keywords: List[str]) -> bool:
         """
         Check if a column name matches any of the keywords.
@@ -730,20 +873,34 @@ class CSVParser(BaseParser):
             print("Warning: No date column identified, cannot parse")
             return []
 
+        # Parse the date column in one pass; it decides which rows start a
+        # transaction, and only those rows need their amounts parsed
+        parsed_dates = parse_date_series(pd.Series(
+            [self._get_cell(row, self.date_col) for row in rows], dtype=object
+        )).tolist()
+        dated = np.array([d is not None for d in parsed_dates], dtype=bool)
+        debits = self._parse_amount_column(rows, self.debit_col, dated, unsigned=True)
+        credits = self._parse_amount_column(rows, self.credit_col, dated, unsigned=True)
+        balances = self._parse_amount_column(rows, self.balance_col, dated)
+
         for row_idx, row in enumerate(rows):
             row_num = row_idx + 1  # 1-based row number
 
             # Skip empty rows
-            if not row or all(not str(cell).strip() for cell in row):
-                continue
-
-            # Skip garbage rows
-            if self._is_garbage_row(row):
+            if not row or not any(cell and cell.strip() for cell in row):
                 continue
 
             # Check if this row has a valid date
-            date_value = self._get_cell(row, self.date_col)
-            parsed_date = parse_date(date_value)
+            parsed_date = parsed_dates[row_idx]
+
+            # Dated rows can't be headers or page markers, so only the
+            # summary-row check applies to them; undated rows get the full
+            # garbage check before being treated as continuations
+            if parsed_date is None:
+                if self._is_garbage_row(row):
+                    continue
+            elif self._is_summary_row(row):
+                continue
 
             if parsed_date is not None:
                 # This is a NEW transaction
@@ -753,9 +910,11 @@ class CSVParser(BaseParser):
 
                 # Extract data for new transaction
                 description = self._extract_description(row)
-                debit, credit = self._extract_amounts(row)
-                balance = self._extract_balance(row)
-                raw_text = " | ".join(str(c) for c in row if str(c).strip())
+                debit, credit = self._extract_amounts(
+                    row, debits[row_idx], credits[row_idx]
+                )
+                balance = balances[row_idx]
+                raw_text = " | ".join(filter(None, map(str.strip, row)))
 
                 current_txn = Transaction(
                     date=parsed_date,
@@ -782,7 +941,7 @@ class CSVParser(BaseParser):
                     current_txn.row_numbers.append(row_num)
 
                     # Append to raw text
-                    row_text = " | ".join(str(c) for c in row if str(c).strip())
+                    row_text = " | ".join(filter(None, map(str.strip, row)))
                     if row_text:
                         current_txn.raw_text += " [cont] " + row_text
 
@@ -828,33 +987,60 @@ class CSVParser(BaseParser):
 
         return " ".join(parts)
 
-    def _extract_amounts(self, row: List[str]) -> Tuple[Optional[float], Optional[float]]:
+    def _parse_amount_column(
+        self,
+        rows: List[List[str]],
+        col_idx: Optional[int],
+        selected: np.ndarray,
+        unsigned: bool = False
+    ) -> List[Optional[float]]:
         """
-        Extract debit and credit amounts from the row.
+        Parse one amount column for the selected rows in bulk.
 
         Args:
-            row: The row
+            rows: All rows from the CSV
+            col_idx: Column index, or None if the column is not mapped
+            selected: Boolean mask of the rows to parse
+            unsigned: Take absolute values and treat zero as no amount
+                      (debit/credit columns)
 
         Returns:
-            Tuple of (debit, credit)
+            One amount per row, None where the cell is empty, invalid,
+            unselected, or zero in an unsigned column
         """
-        debit = None
-        credit = None
-
-        if self.debit_col is not None:
-            debit_value = self._get_cell(row, self.debit_col)
-            if has_valid_amount(debit_value):
-                debit = abs(parse_amount(debit_value))
-                if debit == 0:
-                    debit = None
+        amounts = np.full(len(rows), np.nan)
+
+        if col_idx is not None and selected.any():
+            cells = [
+                self._get_cell(row, col_idx)
+                for row, keep in zip(rows, selected.tolist()) if keep
+            ]
+            amounts[selected] = parse_amount_series(
+                pd.Series(cells, dtype=object)
+            ).to_numpy()
+            if unsigned:
+                amounts = np.abs(amounts)
+                amounts[amounts == 0] = np.nan
+
+        return [None if a != a else a for a in amounts.tolist()]
+
+    def _extract_amounts(
+        self,
+        row: List[str],
+        debit: Optional[float],
+        credit: Optional[float]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """
+        Resolve debit and credit amounts for the row.
 
-        if self.credit_col is not None:
-            credit_value = self._get_cell(row, self.credit_col)
-            if has_valid_amount(credit_value):
-                credit = abs(parse_amount(credit_value))
-                if credit == 0:
-                    credit = None
+        Args:
+            row: The row
+            debit: Parsed debit column value, if any
+            credit: Parsed credit column value, if any
 
+        Returns:
+            Tuple of (debit, credit)
+        """
         # If using single amount column
         if self.amount_col is not None and debit is None and credit is None:
             amount_value = self._get_cell(row, self.amount_col)
@@ -863,76 +1049,62 @@ class CSVParser(BaseParser):
 
         return debit, credit
 
-    def _extract_balance(self, row: List[str]) -> Optional[float]:
+    def _is_garbage_row(self, row: List[str]) -> bool:
         """
-        Extract balance from the row.
+        Check if a row is garbage (should be skipped).
+
+        Uses bank profile patterns if available for more accurate detection.
 
         Args:
             row: The row
 
         Returns:
-            Balance amount or None
+            True if the row should be skipped
         """
-        if self.balance_col is None:
-            return None
+        row_text = " ".join(str(c).lower() for c in row if str(c).strip())
 
-        balance_value = self._get_cell(row, self.balance_col)
-        if has_valid_amount(balance_value):
-            return parse_amount(balance_value)
+        # Skip summary rows (also uses bank profile patterns if available)
+        if self._is_summary_row(row, row_text):
+            return True
 
-        return None
+        # Skip page number, "continued" and disclaimer/footer rows
+        if _GARBAGE_ROW_RE.search(row_text.strip()):
+            return True
 
-    def _is_garbage_row(self, row: List[str]) -> bool:
+        # Skip rows that look like repeated headers
+        header_score = self._score_header_row(row)
+        if header_score >= 3:
+            return True
+
+        return False
+
+    def _is_summary_row(self, row: List[str], row_text: Optional[str] = None) -> bool:
         """
-        Check if a row is garbage (should be skipped).
+        Check if a row is a summary/total row (should be skipped).
 
-        Uses bank profile patterns if available for more accurate detection.
+        Unlike headers and page markers, summary rows such as "Opening Balance"
+        can carry a valid date, so this check also runs on dated rows.
 
         Args:
             row: The row
+            row_text: Pre-joined lowercase row text, if already computed
 
         Returns:
             True if the row should be skipped
         """
-        row_text = " ".join(str(c).lower() for c in row if str(c).strip())
+        if row_text is None:
+            row_text = " ".join(str(c).lower() for c in row if str(c).strip())
 
         # Use bank profile for skip detection if available
         if _HAS_BANK_PROFILES and self._bank_profile:
             manager = get_profile_manager()
-            if manager.should_skip_row(row, self._bank_profile):
+            if manager.should_skip_row(row, self._bank_profile, row_text):
                 return True
 
-        # Skip page number rows (multiple patterns)
-        page_patterns = [
-            r'^page\s*\d+',
-            r'page\s+\d+\s+of\s+\d+',
-            r'page\s+\d+[-/]\d+',
-            r'^\d+\s+of\s+\d+$',  # "1 of 5"
-        ]
-        for pattern in page_patterns:
-            if re.search(pattern, row_text.strip()):
-                return True
-
-        # Skip rows that look like repeated headers
-        header_score = self._score_header_row(row)
-        if header_score >= 3:
-            return True
-
-        # Skip summary rows
         for keyword in SKIP_ROW_KEYWORDS:
             if keyword in row_text:
                 return True
 
-        # Skip rows with "continued" or similar
-        if 'continued' in row_text or 'contd' in row_text:
-            return True
-
-        # Skip disclaimer/footer rows
-        footer_keywords = ['disclaimer', 'terms and conditions', 'this is a computer generated']
-        for keyword in footer_keywords:
-            if keyword in row_text:
-                return True
-
         return False
 
     def preview_rows(self, num_rows: int = 10) -> List[List[str]]:
@@ -945,8 +1117,9 @@ class CSVParser(BaseParser):
         Returns:
             List of rows
         """
-        rows = self._read_csv()
-        return rows[:num_rows]
+        if self._preview_cache is None or len(self._preview_cache) < num_rows:
+            self._preview_cache = self._read_csv(max_rows=num_rows)
+        return self._preview_cache[:num_rows]
 
     def set_column_mapping(
         self,
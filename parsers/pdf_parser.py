@@ -8,10 +8,17 @@ Handles:
 - Indian financial statement formats (Ind AS / Companies Act)
 - Multi-period columns (current year, previous year)
 """
+import functools
 import logging
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 try:
     import pdfplumber
@@ -19,6 +26,12 @@ try:
 except ImportError:
     _HAS_PDFPLUMBER = False
 
+try:
+    import pypdfium2 as pdfium
+    _HAS_PYPDFIUM2 = True
+except ImportError:
+    _HAS_PYPDFIUM2 = False
+
 from normalizer.amount_parser import parse_amount
 
 logger = logging.getLogger(__name__)
@@ -28,21 +41,31 @@ logger = logging.getLogger(__name__)
 # Data structures
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class PnLLineItem:
-    """A single line item extracted from a P&L statement."""
+    """
+    A single line item extracted from a P&L statement.
+
+    ``amounts`` holds one value per period column (None where blank).
+    """
     label: str
-    amounts: List[Optional[float]] = field(default_factory=list)
+    amounts: Tuple[Optional[float], ...] = ()
     note_ref: Optional[str] = None
     indent_level: int = 0          # 0 = section header, 1 = item, 2 = sub-item
     is_total: bool = False
     page_number: int = 0
     raw_text: str = ""
 
+    def __post_init__(self) -> None:
+        # Labels and note refs recur across pages and periods; keep one copy
+        self.label = sys.intern(self.label)
+        if self.note_ref is not None:
+            self.note_ref = sys.intern(self.note_ref)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "label": self.label,
-            "amounts": self.amounts,
+            "amounts": list(self.amounts),
             "note_ref": self.note_ref,
             "indent_level": self.indent_level,
             "is_total": self.is_total,
@@ -50,7 +73,7 @@ class PnLLineItem:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PnLPageMatch:
     """Represents a page identified as containing P&L data."""
     page_number: int          # 1-based
@@ -146,6 +169,262 @@ _TOTAL_KEYWORDS = [
     "total other comprehensive",
 ]
 
+# Any total keyword anywhere in a lowercased label
+_RE_IS_TOTAL = re.compile('|'.join(re.escape(kw) for kw in _TOTAL_KEYWORDS))
+
+# Bonus patterns for page scoring (run against lowercased page text)
+_RE_CURRENCY = re.compile(r'[₹]|rs\.?\s|in\s+(lakhs?|crores?|thousands?|millions?)')
+_RE_NOTE_REF = re.compile(r'note\s*(?:no\.?)?\s*\d')
+_RE_PERIOD = re.compile(r'(?:year|period)\s+ended|for\s+the\s+(?:year|period)')
+_RE_INDIAN_AMT = re.compile(r'\d{1,3}(?:,\d{2,3})*(?:\.\d{1,2})?')
+
+
+# Substrings marking a P&L section header (labels without amounts)
+_SECTION_HEADER_KEYWORDS = (
+    "income", "revenue", "expenses", "expenditure",
+    "continuing operations", "discontinued operations",
+    "other comprehensive", "items that will",
+    "items that may", "i.", "ii.", "iii.", "iv.", "v.",
+    "a.", "b.", "c.", "d.",
+)
+_RE_SECTION_HEADER = re.compile(
+    '|'.join(re.escape(kw) for kw in _SECTION_HEADER_KEYWORDS)
+)
+
+
+# ---------------------------------------------------------------------------
+# Precompiled patterns for per-row / per-cell parsing
+# ---------------------------------------------------------------------------
+
+def _compile_skip_patterns(patterns: List[str]) -> re.Pattern:
+    """Fuse anchored label skip patterns into one regex for ``.match``."""
+    return re.compile('|'.join(f'(?:{p})' for p in patterns))
+
+
+# Words marking a table's header row
+_TABLE_HEADER_LABELS = ("particulars", "note", "description", "items")
+
+_RE_NOTE_REF_CELL = re.compile(r'^\d{1,3}[a-z]?$')
+_RE_TRAILING_NOTE_REF = re.compile(r'\s+(\d{1,3}[a-z]?)\s*$')
+_RE_HEADER_PERIOD = re.compile(r'(?:year|period)\s+ended|20\d{2}|march|31st|fy\s*\d{2}')
+_RE_NOTE_HEADER = re.compile(r'\bnote\b', re.IGNORECASE)
+# Numeric tokens in a text line. Tokens with a thousands separator or a
+# decimal part are tagged "amt" (real amounts) and expose their parts so
+# they can be converted without re-cleaning the text; bare 1-3 digit runs
+# such as note refs or pieces of years still match so tokenisation stays
+# the same.
+_RE_LINE_TOKEN = re.compile(
+    r'(?P<amt>(?P<sign>[\(\-])?(?P<int>\d{1,3})'
+    r'(?:(?P<groups>(?:,\d{2,3})+)(?:\.(?P<frac>\d{1,2}))?|\.(?P<dec>\d{1,2}))'
+    r'(?P<close>\))?)'
+    r'|[\(\-]?\d{1,3}[\)]?'
+)
+_RE_AMOUNT_FULL = re.compile(r'^[\(\-]?\d{1,3}(?:[,]\d{2,3})*(?:\.\d{1,2})?[\)]?$')
+# Every character that can appear in a token _RE_AMOUNT_FULL accepts
+_AMOUNT_CHARS = "0123456789,.()- "
+_RE_CID = re.compile(r'\(cid:\d+\)')
+_RE_WHITESPACE = re.compile(r'\s+')
+# Explicit sub-item markers: "(a)".."(d)", "(i)", "(ii)", "a)", "iv." etc.
+_RE_INDENT_MARKER = re.compile(r'\((?:[a-d]|ii?)\)|[a-z]\)|[ivxIVX]+[\.\)]')
+
+# Fewest ruling edges a page can have and still hold a bordered table
+_MIN_TABLE_EDGES = 4
+
+# (page_idx, score, matched_keywords, page_text) for an identified page
+_ScoredPage = Tuple[int, float, List[str], str]
+
+# Plain-text extraction backends accepted by PDFPnLParser(text_backend=...)
+_TEXT_BACKENDS = ("pdfplumber", "pypdfium2")
+
+# Page scoring is farmed out to worker processes only for documents at least
+# this long; below it, process start-up costs more than it saves.
+_PARALLEL_MIN_PAGES = 32
+
+# Labels that are table furniture rather than line items, per strategy
+_RE_SKIP_TABLE_ROW = _compile_skip_patterns([
+    r'^page\s+\d+',
+    r'^note\s*$',
+    r'^particulars\s*$',
+    r'^sr\.?\s*no',
+    r'^s\.?\s*no',
+    r'^\(?\s*₹',
+    r'^in\s+(lakhs?|crores?|thousands?|millions?)',
+    r'^amount\s+in',
+])
+_RE_SKIP_POSITIONED_LINE = _compile_skip_patterns([
+    r'^page\s+\d+',
+    r'^note\s*$',
+    r'^particulars\s*$',
+    r'^\(?\s*₹',
+    r'^in\s+(lakhs?|crores?)',
+    r'^amount\s+in',
+])
+_RE_SKIP_TEXT_LINE = _compile_skip_patterns([
+    r'^page\s+\d+',
+    r'^note\s+no',
+    r'^sl\.?\s*no',
+    r'^sr\.?\s*no',
+    r'^particulars\s*$',
+    r'^\(?\s*₹',
+    r'^in\s+(lakhs?|crores?)',
+    r'^amount\s+in',
+    r'^\d+\s*$',
+])
+
+
+# ---------------------------------------------------------------------------
+# Page scoring
+# ---------------------------------------------------------------------------
+
+# Largest total the four bonus patterns can add to a page score
+_MAX_BONUS_SCORE = 4.0
+
+_PageScorer = Callable[[str], Optional[Tuple[float, List[str]]]]
+
+
+def _make_scorer(min_score: float) -> _PageScorer:
+    """
+    Build a page scorer specialised for one identification threshold.
+
+    The returned function takes raw page text and returns
+    (score, list_of_matched_keywords) for pages scoring at least
+    ``min_score``, or None otherwise. Keyword tuples, bound regex methods
+    and the threshold are captured as closure locals.
+    """
+    primary = tuple(_PNL_PRIMARY_KEYWORDS)
+    secondary = tuple(_PNL_SECONDARY_KEYWORDS)
+    negative = tuple(_PNL_NEGATIVE_KEYWORDS)
+    # Below this after the keyword passes, no combination of bonuses can
+    # lift a page to the threshold (scores are clamped at 0, so only
+    # meaningful for positive thresholds)
+    bonus_floor = min_score - _MAX_BONUS_SCORE if min_score > 0 else float("-inf")
+    currency_search = _RE_CURRENCY.search
+    note_ref_search = _RE_NOTE_REF.search
+    period_search = _RE_PERIOD.search
+    indian_amt_finditer = _RE_INDIAN_AMT.finditer
+
+    def score_page(text: str) -> Optional[Tuple[float, List[str]]]:
+        text = text.lower()
+        score = 0.0
+        matched: List[str] = []
+
+        # Negative keywords (reduce score)
+        for kw in negative:
+            if kw in text:
+                score -= 2.0
+
+        # Primary keywords (high value)
+        for kw in primary:
+            if kw in text:
+                score += 5.0
+                matched.append(kw)
+
+        # Secondary keywords (medium value)
+        for kw in secondary:
+            if kw in text:
+                score += 1.0
+                matched.append(kw)
+
+        # Quick reject: notes, reports and other statements whose keyword
+        # score cannot reach the threshold even with every bonus
+        if score < bonus_floor:
+            return None
+
+        # Bonus: presence of Indian currency formatting (₹ or Rs or Lakhs/Crores)
+        if currency_search(text):
+            score += 1.0
+
+        # Bonus: note reference numbers typical in Indian financials
+        if note_ref_search(text):
+            score += 0.5
+
+        # Bonus: column headers like "Year ended" or "For the year"
+        if period_search(text):
+            score += 1.5
+            matched.append("period header")
+
+        # Bonus: looks like it has amounts in Indian format (stop counting
+        # at five rather than collecting every match)
+        amount_count = 0
+        for _ in indian_amt_finditer(text):
+            amount_count += 1
+            if amount_count >= 5:
+                score += 1.0
+                break
+
+        score = max(score, 0.0)
+        if score < min_score:
+            return None
+        return score, matched
+
+    return score_page
+
+
+# ---------------------------------------------------------------------------
+# Amount parsing
+# ---------------------------------------------------------------------------
+
+# Cell values meaning "no amount"
+_NIL_AMOUNTS = frozenset(("-", "--", "–", "—", "nil", "Nil", "NIL", ""))
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_amount_text(text: str) -> Optional[float]:
+    """
+    Parse a stripped, non-nil amount string.
+
+    Memoised because statements repeat the same amount strings across rows
+    and period columns.
+    """
+    # Check for negative (parentheses)
+    negative = False
+    if text.startswith("(") and text.endswith(")"):
+        negative = True
+        text = text[1:-1]
+    elif text.startswith("-"):
+        negative = True
+        text = text[1:]
+
+    # Remove commas and spaces
+    text = text.replace(",", "").replace(" ", "")
+
+    if not text:
+        return None
+
+    try:
+        value = float(text)
+        return -value if negative else value
+    except ValueError:
+        return None
+
+
+def _amount_from_token(m: re.Match) -> Optional[float]:
+    """
+    Convert an "amt" match of _RE_LINE_TOKEN to a float.
+
+    Mirrors _parse_financial_amount: "(x)" and "-x" are negative, while
+    unbalanced brackets ("(x", "x)", "-x)") are not valid amounts.
+    """
+    sign, close = m.group("sign"), m.group("close")
+    if sign == "(":
+        if not close:
+            return None
+        negative = True
+    else:
+        if close:
+            return None
+        negative = sign == "-"
+
+    groups = m.group("groups")
+    if groups:
+        digits = m.group("int") + groups.replace(",", "")
+        frac = m.group("frac")
+    else:
+        digits = m.group("int")
+        frac = m.group("dec")
+    value = float(f"{digits}.{frac}" if frac else digits)
+    return -value if negative else value
+
 
 # ---------------------------------------------------------------------------
 # Main parser class
@@ -157,9 +436,12 @@ class PDFPnLParser:
 
     Usage::
 
-        parser = PDFPnLParser("annual_report.pdf")
-        pages = parser.identify_pnl_pages()
-        items = parser.extract_all()
+        with PDFPnLParser("annual_report.pdf") as parser:
+            pages = parser.identify_pnl_pages()
+            items = parser.extract_all()
+
+    The PDF is opened once and shared by identification and extraction;
+    call ``close()`` (or use the parser as a context manager) to release it.
     """
 
     def __init__(
@@ -168,21 +450,81 @@ class PDFPnLParser:
         *,
         page_range: Optional[Tuple[int, int]] = None,
         min_identification_score: float = 3.0,
+        max_workers: Optional[int] = 1,
+        text_backend: str = "pdfplumber",
     ):
         if not _HAS_PDFPLUMBER:
             raise ImportError(
                 "pdfplumber is required for PDF parsing. "
                 "Install it with: pip install pdfplumber"
             )
+        if text_backend not in _TEXT_BACKENDS:
+            raise ValueError(
+                f"Unknown text backend '{text_backend}' "
+                f"(expected one of: {', '.join(_TEXT_BACKENDS)})"
+            )
+        if text_backend == "pypdfium2" and not _HAS_PYPDFIUM2:
+            raise ImportError(
+                "pypdfium2 is required for the pypdfium2 text backend. "
+                "Install it with: pip install pypdfium2"
+            )
 
         self.filepath = filepath
         self.page_range = page_range
         self.min_identification_score = min_identification_score
+        # Worker processes for page scoring (1 = in-process, the default;
+        # None = one per CPU). Only the CLI opts in: forking from the
+        # threaded web workers risks inheriting held locks.
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # Plain-text source for page scoring and the line-regex strategy;
+        # table and word-position strategies always use pdfplumber
+        self.text_backend = text_backend
 
         self._pdf = None
+        self._pdfium_doc = None
         self._pnl_pages: List[PnLPageMatch] = []
         self._line_items: List[PnLLineItem] = []
         self._column_headers: List[str] = []
+        # Page text captured while scoring identified pages (1-based keys)
+        self._page_text_cache: Dict[int, str] = {}
+
+    def __enter__(self) -> "PDFPnLParser":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _open(self) -> Any:
+        """Open the PDF on first use and return the shared handle."""
+        if self._pdf is None:
+            self._pdf = pdfplumber.open(self.filepath)
+        return self._pdf
+
+    def _open_pdfium(self) -> Any:
+        """Open the PDF with pypdfium2 on first use and return the handle."""
+        if self._pdfium_doc is None:
+            self._pdfium_doc = pdfium.PdfDocument(self.filepath)
+        return self._pdfium_doc
+
+    def _page_count(self) -> int:
+        """
+        Return the number of pages using the text backend's own handle.
+
+        The pypdfium2 backend never needs pdfplumber for scoring, so it does
+        not open the file with pdfplumber just to count pages.
+        """
+        if self.text_backend == "pypdfium2":
+            return len(self._open_pdfium())
+        return len(self._open().pages)
+
+    def close(self) -> None:
+        """Close the underlying PDF file(s) if open."""
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+        if self._pdfium_doc is not None:
+            self._pdfium_doc.close()
+            self._pdfium_doc = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -194,27 +536,35 @@ class PDFPnLParser:
         sorted by confidence score (highest first).
         """
         self._pnl_pages = []
+        self._page_text_cache = {}
+        min_score = self.min_identification_score
+        scorer = _make_scorer(min_score)
+
+        num_pages = self._page_count()
+        start = (self.page_range[0] - 1) if self.page_range else 0
+        end = self.page_range[1] if self.page_range else num_pages
+        end = min(end, num_pages)
+
+        if self.max_workers > 1 and end - start >= _PARALLEL_MIN_PAGES:
+            scored = self._score_pages_parallel(start, end)
+        elif self.text_backend == "pypdfium2":
+            scored = _score_pages(
+                _iter_pdfium_texts(self._open_pdfium(), start, end), scorer
+            )
+        else:
+            scored = _score_pages(
+                _iter_plumber_texts(self._open(), start, end), scorer
+            )
 
-        with pdfplumber.open(self.filepath) as pdf:
-            start = (self.page_range[0] - 1) if self.page_range else 0
-            end = self.page_range[1] if self.page_range else len(pdf.pages)
-
-            for page_idx in range(start, min(end, len(pdf.pages))):
-                page = pdf.pages[page_idx]
-                page_num = page_idx + 1  # 1-based
-
-                text = (page.extract_text() or "").lower()
-                if not text.strip():
-                    continue
-
-                score, matched = self._score_page(text)
-
-                if score >= self.min_identification_score:
-                    self._pnl_pages.append(PnLPageMatch(
-                        page_number=page_num,
-                        score=score,
-                        matched_keywords=matched,
-                    ))
+        for page_idx, score, matched, text in scored:
+            page_num = page_idx + 1  # 1-based
+            self._pnl_pages.append(PnLPageMatch(
+                page_number=page_num,
+                score=score,
+                matched_keywords=matched,
+            ))
+            # Keep the text so the line-regex strategy need not extract it again
+            self._page_text_cache[page_num] = text
 
         # Sort by score descending
         self._pnl_pages.sort(key=lambda p: p.score, reverse=True)
@@ -247,11 +597,12 @@ class PDFPnLParser:
 
         self._line_items = []
 
-        with pdfplumber.open(self.filepath) as pdf:
-            for pm in self._pnl_pages:
-                page = pdf.pages[pm.page_number - 1]
-                items = self._extract_from_page(page, pm.page_number)
-                self._line_items.extend(items)
+        pdf = self._open()
+        for pm in self._pnl_pages:
+            page = pdf.pages[pm.page_number - 1]
+            items = self._extract_from_page(page, pm.page_number)
+            page.flush_cache()
+            self._line_items.extend(items)
 
         if not self._line_items:
             pages_str = ", ".join(str(p.page_number) for p in self._pnl_pages)
@@ -264,13 +615,15 @@ class PDFPnLParser:
 
     def extract_from_specific_page(self, page_number: int) -> List[PnLLineItem]:
         """Extract P&L line items from a specific page (1-based)."""
-        with pdfplumber.open(self.filepath) as pdf:
-            if page_number < 1 or page_number > len(pdf.pages):
-                raise ValueError(
-                    f"Page {page_number} out of range (PDF has {len(pdf.pages)} pages)"
-                )
-            page = pdf.pages[page_number - 1]
-            return self._extract_from_page(page, page_number)
+        pdf = self._open()
+        if page_number < 1 or page_number > len(pdf.pages):
+            raise ValueError(
+                f"Page {page_number} out of range (PDF has {len(pdf.pages)} pages)"
+            )
+        page = pdf.pages[page_number - 1]
+        items = self._extract_from_page(page, page_number)
+        page.flush_cache()
+        return items
 
     @property
     def line_items(self) -> List[PnLLineItem]:
@@ -296,51 +649,29 @@ class PDFPnLParser:
     # Page scoring / identification
     # ------------------------------------------------------------------
 
-    def _score_page(self, text: str) -> Tuple[float, List[str]]:
+    def _score_pages_parallel(
+        self, start: int, end: int
+    ) -> List[_ScoredPage]:
         """
-        Score a page for likelihood of containing P&L data.
+        Score pages [start, end) across worker processes.
 
-        Returns (score, list_of_matched_keywords).
+        Pages are split into contiguous ranges so each worker opens the
+        PDF once per range rather than once per page.
         """
-        score = 0.0
-        matched: List[str] = []
-
-        # Primary keywords (high value)
-        for kw in _PNL_PRIMARY_KEYWORDS:
-            if kw in text:
-                score += 5.0
-                matched.append(kw)
-
-        # Secondary keywords (medium value)
-        for kw in _PNL_SECONDARY_KEYWORDS:
-            if kw in text:
-                score += 1.0
-                matched.append(kw)
-
-        # Negative keywords (reduce score)
-        for kw in _PNL_NEGATIVE_KEYWORDS:
-            if kw in text:
-                score -= 2.0
-
-        # Bonus: presence of Indian currency formatting (₹ or Rs or Lakhs/Crores)
-        if re.search(r'[₹]|rs\.?\s|in\s+(lakhs?|crores?|thousands?|millions?)', text):
-            score += 1.0
-
-        # Bonus: note reference numbers typical in Indian financials
-        if re.search(r'note\s*(?:no\.?)?\s*\d', text):
-            score += 0.5
-
-        # Bonus: column headers like "Year ended" or "For the year"
-        if re.search(r'(?:year|period)\s+ended|for\s+the\s+(?:year|period)', text):
-            score += 1.5
-            matched.append("period header")
-
-        # Bonus: looks like it has amounts in Indian format
-        indian_amounts = re.findall(r'\d{1,3}(?:,\d{2,3})*(?:\.\d{1,2})?', text)
-        if len(indian_amounts) >= 5:
-            score += 1.0
-
-        return max(score, 0.0), matched
+        workers = min(self.max_workers, end - start)
+        chunk = max(1, -(-(end - start) // (4 * workers)))
+        starts = list(range(start, end, chunk))
+        ends = [min(s + chunk, end) for s in starts]
+
+        scored: List[_ScoredPage] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for results in executor.map(
+                _score_page_range, repeat(self.filepath), starts, ends,
+                repeat(self.min_identification_score),
+                repeat(self.text_backend),
+            ):
+                scored.extend(results)
+        return scored
 
     # ------------------------------------------------------------------
     # Line item extraction from a single page
@@ -377,7 +708,9 @@ class PDFPnLParser:
             return items
 
         # Strategy 3: Line-by-line regex extraction (last resort)
-        items = self._extract_via_line_regex(page, page_number)
+        items = self._extract_via_line_regex(
+            page, page_number, text=self._page_text_cache.get(page_number)
+        )
         if items:
             logger.info(
                 "Page %d: extracted %d items via line-regex strategy",
@@ -396,14 +729,18 @@ class PDFPnLParser:
         self, page: Any, page_number: int
     ) -> List[PnLLineItem]:
         """Extract using pdfplumber's built-in table finder."""
-        tables = page.extract_tables(
-            table_settings={
-                "vertical_strategy": "lines",
-                "horizontal_strategy": "lines",
-                "snap_tolerance": 5,
-                "join_tolerance": 5,
-            }
-        )
+        # The "lines" strategy needs at least two horizontal and two vertical
+        # ruling edges (lines or rect sides); skip it on borderless pages
+        tables = []
+        if len(page.edges) >= _MIN_TABLE_EDGES:
+            tables = page.extract_tables(
+                table_settings={
+                    "vertical_strategy": "lines",
+                    "horizontal_strategy": "lines",
+                    "snap_tolerance": 5,
+                    "join_tolerance": 5,
+                }
+            )
 
         if not tables:
             # Try with text strategy (for borderless tables)
@@ -423,22 +760,27 @@ class PDFPnLParser:
 
         items: List[PnLLineItem] = []
 
-        for table in tables:
-            if not table or len(table) < 2:
+        for raw_table in tables:
+            if not raw_table or len(raw_table) < 2:
                 continue
 
+            # Width of the widest row; a table needs a label column plus at
+            # least one amount column to be worth parsing
+            num_cols = max((len(row) for row in raw_table if row), default=0)
+            if num_cols < 2:
+                continue
+
+            table = self._clean_table(raw_table, num_cols)
+
             # Find the header row and amount columns
-            header_idx, amount_cols = self._find_table_structure(table)
+            header_idx, amount_cols = self._find_table_structure(table, num_cols)
             if amount_cols is None:
                 continue
 
             # Extract header labels for amount columns
             if header_idx is not None and header_idx < len(table):
                 header_row = table[header_idx]
-                self._column_headers = [
-                    self._clean_text(header_row[c]) if c < len(header_row) else ""
-                    for c in amount_cols
-                ]
+                self._column_headers = [header_row[c] for c in amount_cols]
 
             # Process data rows
             data_start = (header_idx + 1) if header_idx is not None else 0
@@ -449,138 +791,128 @@ class PDFPnLParser:
 
         return items
 
+    def _clean_table(
+        self, table: List[List[Optional[str]]], num_cols: int
+    ) -> List[List[str]]:
+        """
+        Clean every cell of an extracted table once.
+
+        Returns a rectangular grid of cleaned strings, with rows padded
+        with "" to ``num_cols`` (the widest row's length).
+        """
+        clean = self._clean_text
+        grid: List[List[str]] = []
+        for row in table:
+            cells = [clean(c) if c else "" for c in (row or [])]
+            cells.extend([""] * (num_cols - len(cells)))
+            grid.append(cells)
+        return grid
+
     def _find_table_structure(
-        self, table: List[List[Optional[str]]]
+        self, table: List[List[str]], num_cols: int
     ) -> Tuple[Optional[int], Optional[List[int]]]:
         """
         Find the header row and which columns contain amounts.
 
+        ``table`` is a cleaned, rectangular grid from ``_clean_table`` that
+        is ``num_cols`` wide.
+
         Returns (header_row_index, list_of_amount_column_indices).
         """
         # Look for header row in first few rows
         for row_idx, row in enumerate(table[:5]):
-            if not row:
-                continue
-
-            row_text = " ".join(
-                self._clean_text(c) for c in row if c
-            ).lower()
+            row_text = " ".join(c for c in row if c).lower()
 
             # Check for P&L header indicators
-            has_label = any(
-                kw in row_text
-                for kw in ["particulars", "note", "description", "items"]
-            )
-            has_period = bool(re.search(
-                r'(?:year|period)\s+ended|20\d{2}|march|31st|fy\s*\d{2}',
-                row_text,
-            ))
+            has_label = any(kw in row_text for kw in _TABLE_HEADER_LABELS)
+            has_period = bool(_RE_HEADER_PERIOD.search(row_text))
 
             if has_label or has_period:
                 # Identify amount columns: columns that contain year/period info
                 # or are numeric in subsequent rows
-                amount_cols = self._identify_amount_columns(table, row_idx)
+                amount_cols = self._identify_amount_columns(
+                    table, row_idx, num_cols
+                )
                 if amount_cols:
                     return row_idx, amount_cols
 
         # No header found; try to infer from data
-        amount_cols = self._identify_amount_columns_from_data(table)
+        amount_cols = self._identify_amount_columns_from_data(table, num_cols)
         if amount_cols:
             return None, amount_cols
 
         return None, None
 
     def _identify_amount_columns(
-        self, table: List[List[Optional[str]]], header_idx: int
+        self, table: List[List[str]], header_idx: int, num_cols: int
     ) -> List[int]:
         """Identify which columns hold amounts by checking data rows below the header."""
         if header_idx + 1 >= len(table):
             return []
 
-        num_cols = max(len(row) for row in table if row)
-        amount_scores = [0] * num_cols
-        has_large_number = [False] * num_cols  # Track if column has financial-sized numbers
-
         # Also check the header row for "note" keyword to exclude note columns
-        note_cols: set = set()
-        if header_idx < len(table) and table[header_idx]:
-            for ci, hcell in enumerate(table[header_idx]):
-                if hcell and re.search(r'\bnote\b', self._clean_text(hcell).lower()):
-                    note_cols.add(ci)
+        note_cols = {
+            ci for ci, hcell in enumerate(table[header_idx])
+            if hcell and _RE_NOTE_HEADER.search(hcell)
+        }
 
         # Check a sample of data rows
         sample = table[header_idx + 1: header_idx + 10]
-        for row in sample:
-            for col_idx in range(min(len(row), num_cols)):
-                cell = self._clean_text(row[col_idx]) if row[col_idx] else ""
-                if self._looks_like_amount(cell):
-                    amount_scores[col_idx] += 1
-                    # Check if this is a "real" financial amount (has comma or decimal
-                    # or is a larger number, not just a 1-2 digit note ref)
-                    clean = cell.replace("(", "").replace(")", "").replace("-", "")
-                    if "," in clean or "." in clean or len(clean.replace(" ", "")) >= 4:
-                        has_large_number[col_idx] = True
+        cells = _cell_array(sample, num_cols)
+        amount_mask = _AMOUNT_CELL(cells).astype(bool)
+        # A "real" financial amount has a comma or decimal or is a larger
+        # number, not just a 1-2 digit note ref
+        large_mask = amount_mask & _FINANCIAL_SIZED_CELL(cells).astype(bool)
 
         # Columns where >40% of sample rows have amounts
         # BUT exclude columns that only have small numbers (likely note refs)
         threshold = max(1, len(sample) * 0.4)
+        candidates = np.flatnonzero(
+            (amount_mask.sum(axis=0) >= threshold) & large_mask.any(axis=0)
+        )
         amount_cols = [
-            i for i, s in enumerate(amount_scores)
-            if s >= threshold
-            and i > 0  # skip first column (usually label)
+            int(i) for i in candidates
+            if i > 0  # skip first column (usually label)
             and i not in note_cols  # skip note columns
-            and has_large_number[i]  # must have at least one financial-sized number
         ]
 
         return amount_cols
 
     def _identify_amount_columns_from_data(
-        self, table: List[List[Optional[str]]]
+        self, table: List[List[str]], num_cols: int
     ) -> List[int]:
         """Infer amount columns purely from data patterns (no header found)."""
         if len(table) < 3:
             return []
 
-        num_cols = max(len(row) for row in table if row)
-        amount_scores = [0] * num_cols
-
-        for row in table:
-            for col_idx in range(min(len(row), num_cols)):
-                cell = self._clean_text(row[col_idx]) if row[col_idx] else ""
-                if self._looks_like_amount(cell):
-                    amount_scores[col_idx] += 1
+        cells = _cell_array(table, num_cols)
+        amount_scores = _AMOUNT_CELL(cells).astype(bool).sum(axis=0)
 
         threshold = max(2, len(table) * 0.3)
         amount_cols = [
-            i for i, s in enumerate(amount_scores)
-            if s >= threshold and i > 0
+            int(i) for i in np.flatnonzero(amount_scores >= threshold)
+            if i > 0
         ]
 
         return amount_cols
 
     def _parse_table_row(
         self,
-        row: List[Optional[str]],
+        row: List[str],
         amount_cols: List[int],
         page_number: int,
     ) -> Optional[PnLLineItem]:
-        """Parse a single table row into a PnLLineItem."""
-        if not row:
-            return None
-
+        """Parse a single cleaned table row into a PnLLineItem."""
         # First non-empty cell that isn't in an amount column is the label
         label = ""
         note_ref = None
 
-        for col_idx, cell in enumerate(row):
-            if col_idx in amount_cols:
-                continue
-            text = self._clean_text(cell) if cell else ""
-            if not text:
+        for col_idx, text in enumerate(row):
+            if col_idx in amount_cols or not text:
                 continue
 
             # Check if this cell is a note reference (small number, 1-3 digits)
-            if re.match(r'^\d{1,3}[a-z]?$', text):
+            if _RE_NOTE_REF_CELL.match(text):
                 note_ref = text
                 continue
 
@@ -593,52 +925,39 @@ class PDFPnLParser:
         if not label:
             return None
 
-        # Skip rows that are clearly not line items
-        label_lower = label.lower().strip()
-        skip_patterns = [
-            r'^page\s+\d+',
-            r'^note\s*$',
-            r'^particulars\s*$',
-            r'^sr\.?\s*no',
-            r'^s\.?\s*no',
-            r'^\(?\s*₹',
-            r'^in\s+(lakhs?|crores?|thousands?|millions?)',
-            r'^amount\s+in',
-        ]
-        for pattern in skip_patterns:
-            if re.match(pattern, label_lower):
-                return None
+        # Skip rows that are clearly not line items. The stripped label is
+        # kept for the item itself; _detect_indent still sees the original.
+        label_stripped = label.strip()
+        label_lower = label_stripped.lower()
+        if _RE_SKIP_TABLE_ROW.match(label_lower):
+            return None
 
         # Extract amounts
-        amounts: List[Optional[float]] = []
-        for col_idx in amount_cols:
-            if col_idx < len(row) and row[col_idx]:
-                cell_text = self._clean_text(row[col_idx])
-                amt = self._parse_financial_amount(cell_text)
-                amounts.append(amt)
-            else:
-                amounts.append(None)
+        amounts = tuple(
+            self._parse_financial_amount(row[col_idx]) if row[col_idx] else None
+            for col_idx in amount_cols
+        )
 
         # Skip rows with no amounts at all (section headers without numbers
         # are kept only if they look like headings)
         has_any_amount = any(a is not None for a in amounts)
-        if not has_any_amount and not self._looks_like_section_header(label):
+        if not has_any_amount and not self._looks_like_section_header(label_lower):
             return None
 
         # Determine indent level
         indent = self._detect_indent(label)
 
         # Determine if this is a total row
-        is_total = any(kw in label_lower for kw in _TOTAL_KEYWORDS)
+        is_total = bool(_RE_IS_TOTAL.search(label_lower))
 
         return PnLLineItem(
-            label=label.strip(),
+            label=label_stripped,
             amounts=amounts,
             note_ref=note_ref,
             indent_level=indent,
             is_total=is_total,
             page_number=page_number,
-            raw_text=" | ".join(str(c) for c in row if c),
+            raw_text=" | ".join(c for c in row if c),
         )
 
     # ------------------------------------------------------------------
@@ -673,11 +992,16 @@ class PDFPnLParser:
         if not amount_x_ranges:
             return []
 
+        # Column bounds as parallel arrays; a word belongs to a column when
+        # left <= centre <= right + 10
+        col_lefts = np.array([r[0] for r in amount_x_ranges], dtype=np.float64)
+        col_limits = np.array([r[1] for r in amount_x_ranges], dtype=np.float64) + 10
+
         items: List[PnLLineItem] = []
 
         for line_words in lines:
             item = self._parse_positioned_line(
-                line_words, amount_x_ranges, page_number
+                line_words, col_lefts, col_limits, page_number
             )
             if item:
                 items.append(item)
@@ -691,25 +1015,35 @@ class PDFPnLParser:
         if not words:
             return []
 
-        sorted_words = sorted(words, key=lambda w: (w["top"], w["x0"]))
-        lines: List[List[Dict[str, Any]]] = []
-        current_line: List[Dict[str, Any]] = [sorted_words[0]]
-        current_top = sorted_words[0]["top"]
-
-        for word in sorted_words[1:]:
-            if abs(word["top"] - current_top) < 5:
-                current_line.append(word)
-            else:
-                current_line.sort(key=lambda w: w["x0"])
-                lines.append(current_line)
-                current_line = [word]
-                current_top = word["top"]
-
-        if current_line:
-            current_line.sort(key=lambda w: w["x0"])
-            lines.append(current_line)
-
-        return lines
+        count = len(words)
+        tops = np.fromiter((w["top"] for w in words), dtype=np.float64, count=count)
+        x0s = np.fromiter((w["x0"] for w in words), dtype=np.float64, count=count)
+
+        # Reading order: top-to-bottom, then left-to-right
+        order = np.lexsort((x0s, tops))
+        sorted_tops = tops[order]
+
+        # A word starts a new line once it is 5pt or more below the first
+        # word of the current line (anchor-based, so slow drift across a
+        # line does not merge neighbouring rows)
+        line_ids = np.empty(count, dtype=np.intp)
+        line_id = 0
+        anchor = sorted_tops[0]
+        for i, top in enumerate(sorted_tops.tolist()):
+            if abs(top - anchor) >= 5:
+                line_id += 1
+                anchor = top
+            line_ids[i] = line_id
+
+        # Within each line order words by x0 (ties keep reading order)
+        by_line = np.lexsort((sorted_tops, x0s[order], line_ids))
+        final_order = order[by_line]
+        breaks = np.flatnonzero(np.diff(line_ids[by_line])) + 1
+
+        return [
+            [words[i] for i in chunk.tolist()]
+            for chunk in np.split(final_order, breaks)
+        ]
 
     def _detect_amount_columns_from_positions(
         self, lines: List[List[Dict[str, Any]]]
@@ -737,7 +1071,7 @@ class PDFPnLParser:
         for cluster in clusters:
             if len(cluster) < 3:
                 continue
-            right = max(cluster)
+            right = float(cluster[-1])
             # Look left from the right edge to find the start of numbers
             left = right - 120  # Typical column width
             x_ranges.append((left, right))
@@ -747,53 +1081,67 @@ class PDFPnLParser:
 
     def _cluster_values(
         self, values: List[float], tolerance: float = 15
-    ) -> List[List[float]]:
-        """Simple 1D clustering."""
+    ) -> List[np.ndarray]:
+        """
+        Simple 1D clustering.
+
+        Sorted values are split wherever the gap to the previous value
+        exceeds ``tolerance``; each cluster is returned as a sorted array.
+        """
         if not values:
             return []
 
-        sorted_vals = sorted(values)
-        clusters: List[List[float]] = [[sorted_vals[0]]]
-
-        for val in sorted_vals[1:]:
-            if val - clusters[-1][-1] <= tolerance:
-                clusters[-1].append(val)
-            else:
-                clusters.append([val])
-
-        return clusters
+        sorted_vals = np.sort(np.asarray(values, dtype=np.float64))
+        breaks = np.flatnonzero(np.diff(sorted_vals) > tolerance) + 1
+        return np.split(sorted_vals, breaks)
 
     def _parse_positioned_line(
         self,
         line_words: List[Dict[str, Any]],
-        amount_x_ranges: List[Tuple[float, float]],
+        col_lefts: np.ndarray,
+        col_limits: np.ndarray,
         page_number: int,
     ) -> Optional[PnLLineItem]:
-        """Parse a line of positioned words into a PnLLineItem."""
+        """
+        Parse a line of positioned words into a PnLLineItem.
+
+        ``col_lefts``/``col_limits`` hold each amount column's left edge and
+        right edge plus tolerance, sorted left to right.
+        """
+        num_cols = len(col_lefts)
         label_parts: List[str] = []
-        amounts: List[Optional[float]] = [None] * len(amount_x_ranges)
+        amounts: List[Optional[float]] = [None] * num_cols
         note_ref = None
 
-        for word in line_words:
+        # Owning column per word: the first column whose limit reaches the
+        # word centre, provided the centre is not left of that column
+        centers = np.fromiter(
+            ((w["x0"] + w["x1"]) / 2 for w in line_words),
+            dtype=np.float64, count=len(line_words),
+        )
+        col_idx_arr = np.searchsorted(col_limits, centers, side="left")
+        in_col = (col_idx_arr < num_cols) & (
+            centers >= col_lefts[np.minimum(col_idx_arr, num_cols - 1)]
+        )
+
+        for word, col_idx, in_column in zip(
+            line_words, col_idx_arr.tolist(), in_col.tolist()
+        ):
             text = word.get("text", "").strip()
             if not text:
                 continue
 
             # Check if word falls in an amount column
-            word_center = (word["x0"] + word["x1"]) / 2
             placed = False
-            for col_idx, (x_left, x_right) in enumerate(amount_x_ranges):
-                if x_left <= word_center <= x_right + 10:
-                    if self._looks_like_amount(text):
-                        amt = self._parse_financial_amount(text)
-                        if amounts[col_idx] is None:
-                            amounts[col_idx] = amt
-                        placed = True
-                    break
+            if in_column and self._looks_like_amount(text):
+                amt = self._parse_financial_amount(text)
+                if amounts[col_idx] is None:
+                    amounts[col_idx] = amt
+                placed = True
 
             if not placed:
                 # Check if it's a note ref
-                if re.match(r'^\d{1,3}[a-z]?$', text) and not label_parts:
+                if _RE_NOTE_REF_CELL.match(text) and not label_parts:
                     note_ref = text
                 else:
                     label_parts.append(text)
@@ -804,28 +1152,19 @@ class PDFPnLParser:
 
         # Skip non-line-item rows
         label_lower = label.lower()
-        skip_patterns = [
-            r'^page\s+\d+',
-            r'^note\s*$',
-            r'^particulars\s*$',
-            r'^\(?\s*₹',
-            r'^in\s+(lakhs?|crores?)',
-            r'^amount\s+in',
-        ]
-        for pattern in skip_patterns:
-            if re.match(pattern, label_lower):
-                return None
+        if _RE_SKIP_POSITIONED_LINE.match(label_lower):
+            return None
 
         has_any_amount = any(a is not None for a in amounts)
-        if not has_any_amount and not self._looks_like_section_header(label):
+        if not has_any_amount and not self._looks_like_section_header(label_lower):
             return None
 
-        is_total = any(kw in label_lower for kw in _TOTAL_KEYWORDS)
+        is_total = bool(_RE_IS_TOTAL.search(label_lower))
         indent = self._detect_indent(label)
 
         return PnLLineItem(
             label=label,
-            amounts=amounts,
+            amounts=tuple(amounts),
             note_ref=note_ref,
             indent_level=indent,
             is_total=is_total,
@@ -838,13 +1177,20 @@ class PDFPnLParser:
     # ------------------------------------------------------------------
 
     def _extract_via_line_regex(
-        self, page: Any, page_number: int
+        self, page: Any, page_number: int, text: Optional[str] = None
     ) -> List[PnLLineItem]:
         """
         Fallback: extract text line-by-line and use regex to split
         label from amounts.
+
+        ``text`` is the page text if already known (e.g. captured while
+        scoring); otherwise it is extracted here.
         """
-        text = page.extract_text()
+        if text is None:
+            if self.text_backend == "pypdfium2":
+                text = _pdfium_page_text(self._open_pdfium(), page_number - 1)
+            else:
+                text = page.extract_text()
         if not text:
             return []
 
@@ -873,27 +1219,12 @@ class PDFPnLParser:
           "Total Income              1,280.23   1,139.13"
           "(a) Cost of materials consumed  26  (500.00)  (450.00)"
         """
-        # Find all amount-like tokens (including negative/parenthesised)
-        # Pattern matches: 1,234.56 or (1,234.56) or -1,234.56 or 1234
-        amount_pattern = re.compile(
-            r'[\(\-]?\d{1,3}(?:[,]\d{2,3})*(?:\.\d{1,2})?[\)]?'
-        )
-
-        # Split into potential tokens
-        matches = list(amount_pattern.finditer(line))
-
-        if not matches:
-            return None
-
-        # The label is everything before the first amount
-        # Heuristic: real financial amounts contain commas or decimal points,
-        # or are at least 4 digits (to exclude years like "2024" or note refs)
-        real_amounts: List[re.Match] = []
-        for m in matches:
-            val_text = m.group()
-            clean = val_text.replace("(", "").replace(")", "").replace("-", "").replace(",", "")
-            if "," in val_text or "." in val_text or len(clean) >= 4:
-                real_amounts.append(m)
+        # Find all amount-like tokens (including negative/parenthesised).
+        # Real financial amounts contain commas or decimal points, which
+        # excludes years like "2024" and note refs; the regex tags them.
+        real_amounts = [
+            m for m in _RE_LINE_TOKEN.finditer(line) if m.lastgroup == "amt"
+        ]
 
         if not real_amounts:
             return None
@@ -904,7 +1235,7 @@ class PDFPnLParser:
 
         # Remove trailing note reference from label
         note_ref = None
-        note_match = re.search(r'\s+(\d{1,3}[a-z]?)\s*$', label)
+        note_match = _RE_TRAILING_NOTE_REF.search(label)
         if note_match:
             note_ref = note_match.group(1)
             label = label[:note_match.start()].strip()
@@ -914,32 +1245,17 @@ class PDFPnLParser:
 
         # Skip non-line-item labels
         label_lower = label.lower()
-        skip_patterns = [
-            r'^page\s+\d+',
-            r'^note\s+no',
-            r'^sl\.?\s*no',
-            r'^sr\.?\s*no',
-            r'^particulars\s*$',
-            r'^\(?\s*₹',
-            r'^in\s+(lakhs?|crores?)',
-            r'^amount\s+in',
-            r'^\d+\s*$',
-        ]
-        for pattern in skip_patterns:
-            if re.match(pattern, label_lower):
-                return None
+        if _RE_SKIP_TEXT_LINE.match(label_lower):
+            return None
 
         # Parse amounts
-        amounts: List[Optional[float]] = []
-        for m in real_amounts:
-            amt = self._parse_financial_amount(m.group())
-            amounts.append(amt)
+        amounts = tuple(_amount_from_token(m) for m in real_amounts)
 
         has_any = any(a is not None for a in amounts)
-        if not has_any and not self._looks_like_section_header(label):
+        if not has_any and not self._looks_like_section_header(label_lower):
             return None
 
-        is_total = any(kw in label_lower for kw in _TOTAL_KEYWORDS)
+        is_total = bool(_RE_IS_TOTAL.search(label_lower))
         indent = self._detect_indent(label)
 
         return PnLLineItem(
@@ -963,8 +1279,8 @@ class PDFPnLParser:
             return ""
         text = str(cell).strip()
         # Remove PDF CID placeholders (e.g. (cid:10) = newline)
-        text = re.sub(r'\(cid:\d+\)', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_CID.sub(' ', text)
+        text = _RE_WHITESPACE.sub(' ', text)
         return text
 
     @staticmethod
@@ -973,11 +1289,12 @@ class PDFPnLParser:
         if not text:
             return False
         text = text.strip()
+        # Cheap reject: if stripping the amount alphabet leaves anything,
+        # the token has a character no amount can contain
+        if text.lstrip(_AMOUNT_CHARS):
+            return False
         # Matches: 1,234.56 or (1,234.56) or -1,234.56 or 1234.56 or 1,23,456.78
-        return bool(re.match(
-            r'^[\(\-]?\d{1,3}(?:[,]\d{2,3})*(?:\.\d{1,2})?[\)]?$',
-            text.replace(" ", ""),
-        ))
+        return bool(_RE_AMOUNT_FULL.match(text.replace(" ", "")))
 
     @staticmethod
     def _parse_financial_amount(text: str) -> Optional[float]:
@@ -993,58 +1310,27 @@ class PDFPnLParser:
         text = text.strip()
 
         # Nil indicators
-        if text in ("-", "--", "–", "—", "nil", "Nil", "NIL", ""):
+        if text in _NIL_AMOUNTS:
             return None
 
-        # Check for negative (parentheses)
-        negative = False
-        if text.startswith("(") and text.endswith(")"):
-            negative = True
-            text = text[1:-1]
-        elif text.startswith("-"):
-            negative = True
-            text = text[1:]
-
-        # Remove commas and spaces
-        text = text.replace(",", "").replace(" ", "")
-
-        if not text:
-            return None
-
-        try:
-            value = float(text)
-            return -value if negative else value
-        except ValueError:
-            return None
+        return _parse_amount_text(text)
 
     @staticmethod
-    def _looks_like_section_header(label: str) -> bool:
-        """Check if a label looks like a P&L section header."""
-        label_lower = label.lower().strip()
-        section_keywords = [
-            "income", "revenue", "expenses", "expenditure",
-            "continuing operations", "discontinued operations",
-            "other comprehensive", "items that will",
-            "items that may", "i.", "ii.", "iii.", "iv.", "v.",
-            "a.", "b.", "c.", "d.",
-        ]
-        return any(kw in label_lower for kw in section_keywords)
+    def _looks_like_section_header(label_lower: str) -> bool:
+        """Check if an already-lowercased label looks like a P&L section header."""
+        return _RE_SECTION_HEADER.search(label_lower) is not None
 
     @staticmethod
     def _detect_indent(label: str) -> int:
         """Detect indentation level from label formatting."""
         label_stripped = label.lstrip()
-        leading_spaces = len(label) - len(label_stripped)
 
         # Explicit indent markers
-        if label_stripped.startswith(("(a)", "(b)", "(c)", "(d)", "(i)", "(ii)")):
-            return 2
-        if re.match(r'^[a-z]\)', label_stripped):
-            return 2
-        if re.match(r'^[ivxIVX]+[\.\)]', label_stripped):
+        if _RE_INDENT_MARKER.match(label_stripped):
             return 2
 
         # Space-based indent
+        leading_spaces = len(label) - len(label_stripped)
         if leading_spaces >= 8:
             return 2
         elif leading_spaces >= 4:
@@ -1053,6 +1339,116 @@ class PDFPnLParser:
         return 0
 
 
+# ---------------------------------------------------------------------------
+# Cell predicates for table column detection
+# ---------------------------------------------------------------------------
+
+def _is_financial_sized(cell: str) -> bool:
+    """True for amounts with a comma or decimal, or at least four digits."""
+    # Stripping brackets and signs never removes a separator, so most
+    # amounts are decided before any copy of the cell is made
+    if "," in cell or "." in cell:
+        return True
+    clean = cell.replace("(", "").replace(")", "").replace("-", "").replace(" ", "")
+    return len(clean) >= 4
+
+
+def _cell_array(rows: List[List[str]], num_cols: int) -> np.ndarray:
+    """Copy rectangular cleaned rows into a (len(rows), num_cols) object array."""
+    cells = np.empty((len(rows), num_cols), dtype=object)
+    for row_idx, row in enumerate(rows):
+        cells[row_idx] = row
+    return cells
+
+
+# Element-wise versions applied to whole cell grids
+_AMOUNT_CELL = np.frompyfunc(PDFPnLParser._looks_like_amount, 1, 1)
+_FINANCIAL_SIZED_CELL = np.frompyfunc(_is_financial_sized, 1, 1)
+
+
+# ---------------------------------------------------------------------------
+# Page scoring workers
+# ---------------------------------------------------------------------------
+
+def _iter_plumber_texts(
+    pdf: Any, start: int, end: int
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page_idx, text) for pages [start, end) of a pdfplumber PDF.
+
+    Each page's cached layout objects are flushed once its text has been
+    read so memory stays bounded on long annual reports.
+    """
+    for page_idx in range(start, end):
+        page = pdf.pages[page_idx]
+        text = page.extract_text() or ""
+        page.flush_cache()
+        yield page_idx, text
+
+
+def _pdfium_page_text(doc: Any, page_idx: int) -> str:
+    """Return one page's text via PDFium, normalised to newline line endings."""
+    page = doc[page_idx]
+    textpage = page.get_textpage()
+    try:
+        text = textpage.get_text_range()
+    finally:
+        textpage.close()
+        page.close()
+    return text.replace("\r\n", "\n")
+
+
+def _iter_pdfium_texts(
+    doc: Any, start: int, end: int
+) -> Iterator[Tuple[int, str]]:
+    """Yield (page_idx, text) for pages [start, end) of a pypdfium2 document."""
+    for page_idx in range(start, end):
+        yield page_idx, _pdfium_page_text(doc, page_idx)
+
+
+def _score_pages(
+    page_texts: Iterable[Tuple[int, str]], scorer: _PageScorer
+) -> List[_ScoredPage]:
+    """
+    Score (page_idx, text) pairs and keep pages that reach the threshold.
+
+    Blank pages are skipped. Each kept entry carries the page text so it
+    can be reused by the line-regex extraction strategy.
+    """
+    scored: List[_ScoredPage] = []
+    for page_idx, text in page_texts:
+        if not text.strip():
+            continue
+        result = scorer(text)
+        if result is not None:
+            score, matched = result
+            scored.append((page_idx, score, matched, text))
+    return scored
+
+
+def _score_page_range(
+    filepath: str,
+    start: int,
+    end: int,
+    min_score: float,
+    text_backend: str = "pdfplumber",
+) -> List[_ScoredPage]:
+    """
+    Process-pool entry point: open the PDF and score pages [start, end).
+
+    The scorer is built inside the worker since closures do not pickle.
+    """
+    scorer = _make_scorer(min_score)
+    if text_backend == "pypdfium2":
+        doc = pdfium.PdfDocument(filepath)
+        try:
+            return _score_pages(_iter_pdfium_texts(doc, start, end), scorer)
+        finally:
+            doc.close()
+    with pdfplumber.open(filepath) as pdf:
+        return _score_pages(_iter_plumber_texts(pdf, start, end), scorer)
+
+
 # ---------------------------------------------------------------------------
 # Exception
 # ---------------------------------------------------------------------------
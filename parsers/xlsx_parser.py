@@ -2,10 +2,18 @@
 XLSX Parser for direct bank download Excel files.
 """
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import python_calamine
+    _HAS_CALAMINE = True
+except ImportError:
+    _HAS_CALAMINE = False
+
 from config import (
     BALANCE_COLUMN_KEYWORDS,
     CREDIT_COLUMN_KEYWORDS,
@@ -15,10 +23,31 @@ from config import (
     HEADER_KEYWORDS,
     SKIP_ROW_KEYWORDS,
 )
-from normalizer.amount_parser import parse_amount, has_valid_amount
-from normalizer.date_parser import parse_date, is_valid_date
+from normalizer.amount_parser import parse_amount_series
+from normalizer.date_parser import parse_date_series, is_valid_date
 from parsers.base_parser import BaseParser, Transaction, ValidationIssue
 
+# Any summary keyword anywhere in the lowercased row text marks a skip row
+_SKIP_ROW_RE = re.compile("|".join(map(re.escape, SKIP_ROW_KEYWORDS)))
+
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """Compile a keyword list into one substring-matching alternation."""
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_HEADER_RE = _keyword_pattern(HEADER_KEYWORDS)
+
+# Standard column role -> pattern matched against lowercased header names,
+# in the order roles are assigned
+_COLUMN_ROLE_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ('date', _keyword_pattern(DATE_COLUMN_KEYWORDS)),
+    ('description', _keyword_pattern(DESCRIPTION_COLUMN_KEYWORDS)),
+    ('debit', _keyword_pattern(DEBIT_COLUMN_KEYWORDS)),
+    ('credit', _keyword_pattern(CREDIT_COLUMN_KEYWORDS)),
+    ('balance', _keyword_pattern(BALANCE_COLUMN_KEYWORDS)),
+]
+
 
 class XLSXParser(BaseParser):
     """
@@ -37,6 +66,7 @@ class XLSXParser(BaseParser):
         self.sheet_name = sheet_name
         self._header_row: Optional[int] = None
         self._column_mapping: Dict[str, str] = {}
+        self._excel_file: Optional[pd.ExcelFile] = None
 
     def parse(self) -> List[Transaction]:
         """
@@ -77,19 +107,55 @@ class XLSXParser(BaseParser):
         return self._transactions
 
     def _read_excel_raw(self) -> Optional[pd.DataFrame]:
-        """Read Excel file without assuming headers."""
+        """
+        Read Excel file without assuming headers.
+
+        Uses the Rust-based calamine engine when python-calamine is
+        installed, falling back to pandas' default engine (openpyxl/xlrd).
+        """
+        read_kwargs = {
+            'sheet_name': self.sheet_name or 0,
+            'header': None,
+            'dtype': str,
+        }
+
         try:
-            df = pd.read_excel(
-                self.filepath,
-                sheet_name=self.sheet_name or 0,
-                header=None,
-                dtype=str,
-            )
+            if _HAS_CALAMINE:
+                # Only engine-unavailable errors fall back; anything else
+                # (a corrupt or missing file) is reported once below
+                try:
+                    return self._open(engine='calamine').parse(**read_kwargs)
+                except (ImportError, ValueError) as e:
+                    print(f"calamine engine unavailable ({e}), falling back to default engine")
+                    self.close()
+
+            df = self._open().parse(**read_kwargs)
             return df
         except Exception as e:
             print(f"Error reading Excel file: {e}")
             return None
 
+    def _open(self, engine: Optional[str] = None) -> pd.ExcelFile:
+        """
+        Open the workbook on first use and return the shared handle.
+
+        Args:
+            engine: pandas Excel engine to open with; ignored if the
+                    workbook is already open
+
+        Returns:
+            The open ExcelFile
+        """
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self.filepath, engine=engine)
+        return self._excel_file
+
+    def close(self) -> None:
+        """Close the underlying workbook if open."""
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+
     def _apply_header(self, df_raw: pd.DataFrame) -> Optional[pd.DataFrame]:
         """
         Promote the identified header row to column names and drop rows above it.
@@ -103,10 +169,10 @@ class XLSXParser(BaseParser):
                 str(c).strip().lower() if pd.notna(c) else f"col_{i}"
                 for i, c in enumerate(df_raw.iloc[header_idx])
             ]
-            df = df_raw.iloc[header_idx + 1:].copy()
-            df.columns = new_columns
-            df.reset_index(drop=True, inplace=True)
-            return df
+            # set_axis/reset_index return a new frame, so the row slice
+            # needs no explicit copy
+            df = df_raw.iloc[header_idx + 1:]
+            return df.set_axis(new_columns, axis=1).reset_index(drop=True)
         except Exception as e:
             print(f"Error applying header to raw DataFrame: {e}")
             return None
@@ -125,14 +191,20 @@ class XLSXParser(BaseParser):
 
         best_row = 0
         best_score = 0
+        # A row scores at most one point per cell, so once a row matches in
+        # every column no later row can beat it
+        max_score = df.shape[1]
 
-        for idx in range(max_rows_to_check):
-            row = df.iloc[idx]
+        for idx, row in enumerate(
+            df.head(max_rows_to_check).to_numpy(dtype=object).tolist()
+        ):
             score = self._score_header_row(row)
 
             if score > best_score:
                 best_score = score
                 best_row = idx
+                if best_score >= max_score:
+                    break
 
         # If no good header found, assume first row
         if best_score < 3:
@@ -141,26 +213,23 @@ class XLSXParser(BaseParser):
 
         return best_row
 
-    def _score_header_row(self, row: pd.Series) -> int:
+    def _score_header_row(self, row: Sequence[Any]) -> int:
         """
         Score a row based on how likely it is to be a header row.
 
         Args:
-            row: A row from the DataFrame
+            row: The cell values of a DataFrame row
 
         Returns:
             Score (higher = more likely to be header)
         """
-        score = 0
-        row_values = [str(v).strip().lower() for v in row if pd.notna(v)]
-
-        for value in row_values:
-            for keyword in HEADER_KEYWORDS:
-                if keyword in value:
-                    score += 1
-                    break
-
-        return score
+        # Keywords have no surrounding whitespace, so substring matching
+        # needs no strip() on the cell text
+        header_search = _HEADER_RE.search
+        return sum(
+            1 for v in row
+            if pd.notna(v) and header_search(str(v).lower())
+        )
 
     def _identify_columns(self, df: pd.DataFrame) -> Dict[str, str]:
         """
@@ -177,40 +246,10 @@ class XLSXParser(BaseParser):
         for col in df.columns:
             col_lower = str(col).lower()
 
-            # Check for date column
-            if 'date' not in mapping:
-                for keyword in DATE_COLUMN_KEYWORDS:
-                    if keyword in col_lower:
-                        mapping['date'] = col
-                        break
-
-            # Check for description column
-            if 'description' not in mapping:
-                for keyword in DESCRIPTION_COLUMN_KEYWORDS:
-                    if keyword in col_lower:
-                        mapping['description'] = col
-                        break
-
-            # Check for debit column
-            if 'debit' not in mapping:
-                for keyword in DEBIT_COLUMN_KEYWORDS:
-                    if keyword in col_lower:
-                        mapping['debit'] = col
-                        break
-
-            # Check for credit column
-            if 'credit' not in mapping:
-                for keyword in CREDIT_COLUMN_KEYWORDS:
-                    if keyword in col_lower:
-                        mapping['credit'] = col
-                        break
-
-            # Check for balance column
-            if 'balance' not in mapping:
-                for keyword in BALANCE_COLUMN_KEYWORDS:
-                    if keyword in col_lower:
-                        mapping['balance'] = col
-                        break
+            # Each column may fill several roles; a role keeps its first match
+            for role, pattern in _COLUMN_ROLE_PATTERNS:
+                if role not in mapping and pattern.search(col_lower):
+                    mapping[role] = col
 
         return mapping
 
@@ -236,56 +275,72 @@ class XLSXParser(BaseParser):
             print("Warning: No date column identified")
             return []
 
-        for idx, row in df.iterrows():
+        # Pull the cells out of pandas once; the loop below works on plain
+        # Python lists instead of building a Series per row
+        columns = list(df.columns)
+        date_idx = columns.index(date_col)
+        desc_idx = columns.index(desc_col) if desc_col else None
+        debit_idx = columns.index(debit_col) if debit_col else None
+        credit_idx = columns.index(credit_col) if credit_col else None
+        balance_idx = columns.index(balance_col) if balance_col else None
+        notna = pd.notna
+
+        # Rows with an empty date cell can never become transactions, and
+        # parse_date is at its slowest on them (every format plus the dateutil
+        # fallback fails), so drop them up front in one vectorized pass
+        date_column = df.iloc[:, date_idx]
+        has_date = date_column.notna().to_numpy()
+        values = df.to_numpy(dtype=object)
+
+        # Each distinct date string is parsed once for all its rows
+        parsed_dates = np.full(len(df), None, dtype=object)
+        parsed_dates[has_date] = parse_date_series(date_column[has_date]).to_numpy()
+        parsed_dates = parsed_dates.tolist()
+
+        # Descriptions are cleaned for the whole column in one string pass
+        descriptions: Optional[List[str]] = None
+        if desc_idx is not None:
+            descriptions = (
+                df.iloc[:, desc_idx].astype("string").str.strip().fillna("").tolist()
+            )
+
+        # Amount columns are parsed in bulk for the dated rows only
+        debits = self._parse_amount_column(df, debit_idx, has_date, unsigned=True)
+        credits = self._parse_amount_column(df, credit_idx, has_date, unsigned=True)
+        balances = self._parse_amount_column(df, balance_idx, has_date)
+
+        for idx in has_date.nonzero()[0].tolist():
+            row = values[idx].tolist()
+
             # Get actual row number (accounting for header)
             row_num = idx + self._header_row + 2  # +2 for 1-based and header row
 
             # Check if this row has a valid date
-            date_value = row.get(date_col)
-            parsed_date = parse_date(date_value)
+            parsed_date = parsed_dates[idx]
 
             if parsed_date is None:
                 continue
 
+            cells = [str(v) for v in row if notna(v)]
+
             # Check if this is a skip row (summary row)
-            if self._should_skip_row(row):
+            if self._should_skip_row(row, " ".join(cells).lower()):
                 continue
 
             # Extract description
-            description = ""
-            if desc_col:
-                desc_value = row.get(desc_col)
-                if pd.notna(desc_value):
-                    description = str(desc_value).strip()
+            # Narrations repeat heavily (UPI/NEFT boilerplate, standing
+            # instructions), so share one string per distinct value
+            description = (
+                sys.intern(descriptions[idx]) if descriptions is not None else ""
+            )
 
             # Extract amounts
-            debit = None
-            credit = None
-            balance = None
-
-            if debit_col:
-                debit_value = row.get(debit_col)
-                if pd.notna(debit_value) and has_valid_amount(debit_value):
-                    debit = abs(parse_amount(debit_value))
-                    if debit == 0:
-                        debit = None
-
-            if credit_col:
-                credit_value = row.get(credit_col)
-                if pd.notna(credit_value) and has_valid_amount(credit_value):
-                    credit = abs(parse_amount(credit_value))
-                    if credit == 0:
-                        credit = None
-
-            if balance_col:
-                balance_value = row.get(balance_col)
-                if pd.notna(balance_value) and has_valid_amount(balance_value):
-                    balance = parse_amount(balance_value)
+            debit = debits[idx]
+            credit = credits[idx]
+            balance = balances[idx]
 
             # Create raw text for debugging
-            raw_text = " | ".join(
-                str(v) for v in row.values if pd.notna(v)
-            )
+            raw_text = " | ".join(cells)
 
             # Create transaction
             txn = Transaction(
@@ -302,25 +357,56 @@ class XLSXParser(BaseParser):
 
         return transactions
 
-    def _should_skip_row(self, row: pd.Series) -> bool:
+    def _parse_amount_column(
+        self,
+        df: pd.DataFrame,
+        col_idx: Optional[int],
+        rows: np.ndarray,
+        unsigned: bool = False
+    ) -> List[Optional[float]]:
+        """
+        Parse one amount column for the selected rows.
+
+        Args:
+            df: DataFrame with headers
+            col_idx: Position of the amount column, or None if unmapped
+            rows: Boolean mask of the rows to parse
+            unsigned: Take absolute values and treat zero as no amount
+                      (debit/credit columns)
+
+        Returns:
+            One amount per DataFrame row, None where the cell is empty,
+            invalid, unselected, or zero in an unsigned column
+        """
+        amounts = np.full(len(df), np.nan)
+
+        if col_idx is not None:
+            amounts[rows] = parse_amount_series(df.iloc[rows, col_idx]).to_numpy()
+            if unsigned:
+                amounts = np.abs(amounts)
+                amounts[amounts == 0] = np.nan
+
+        return [None if a != a else a for a in amounts.tolist()]
+
+    def _should_skip_row(
+        self, row: Sequence[Any], row_text: Optional[str] = None
+    ) -> bool:
         """
         Check if a row should be skipped (summary row, etc.).
 
         Args:
-            row: A row from the DataFrame
+            row: The cell values of a DataFrame row
+            row_text: Pre-joined lowercase row text, if already computed
 
         Returns:
             True if the row should be skipped
         """
-        row_text = " ".join(
-            str(v).lower() for v in row.values if pd.notna(v)
-        )
-
-        for keyword in SKIP_ROW_KEYWORDS:
-            if keyword in row_text:
-                return True
+        if row_text is None:
+            row_text = " ".join(
+                str(v).lower() for v in row if pd.notna(v)
+            )
 
-        return False
+        return _SKIP_ROW_RE.search(row_text) is not None
 
     def get_available_sheets(self) -> List[str]:
         """
@@ -329,9 +415,14 @@ class XLSXParser(BaseParser):
         Returns:
             List of sheet names
         """
+        if _HAS_CALAMINE:
+            try:
+                return self._open(engine='calamine').sheet_names
+            except Exception:
+                self.close()
+
         try:
-            xl = pd.ExcelFile(self.filepath)
-            return xl.sheet_names
+            return self._open().sheet_names
         except Exception as e:
             print(f"Error reading sheet names: {e}")
             return []
@@ -1,10 +1,14 @@
 """
 Integration tests for the bank statement processor.
 """
+import csv
+import io
 import os
+import random
 import sys
 import tempfile
 import unittest
+from datetime import date, timedelta
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -13,6 +17,54 @@ from categorizer.categorizer import TransactionCategorizer
 from output.excel_generator import generate_output_excel
 
 
+# Generated statement shared by TestGeneratedCSVIntegration (see setUpModule)
+GENERATED_CSV = ""
+GENERATED_EXPECTED = []
+
+
+def setUpModule():
+    """Build a reproducible 5,000-transaction statement in memory."""
+    global GENERATED_CSV, GENERATED_EXPECTED
+
+    rng = random.Random(0)
+    merchants = [
+        "SWIGGY ORDER {}", "UPI/{}/AMAZON PAY", "NEFT CR FROM JOHN DOE {}",
+        "ATM WDL/SBI/BANGALORE {}", "IRCTC TICKET BOOKING {}",
+    ]
+
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["Date", "Description", "Debit", "Credit", "Balance"])
+
+    expected = []
+    balance = 100000.0
+    day = date(2024, 4, 1)
+    for _ in range(5000):
+        day += timedelta(days=rng.randint(0, 1))
+        description = rng.choice(merchants).format(rng.randint(1000, 999999))
+        amount = round(rng.uniform(1, 50000), 2)
+        is_credit = rng.random() < 0.3
+        balance = round(balance + (amount if is_credit else -amount), 2)
+        # Some amounts use thousands separators, which forces quoting
+        amount_text = f"{amount:,.2f}" if rng.random() < 0.2 else f"{amount:.2f}"
+
+        writer.writerow([
+            day.strftime("%d/%m/%Y"), description,
+            "" if is_credit else amount_text, amount_text if is_credit else "",
+            f"{balance:.2f}",
+        ])
+        # Multi-row narrations continue on undated rows
+        for _ in range(rng.choice([0, 0, 0, 1, 2])):
+            extra = f"REF {rng.randint(10 ** 6, 10 ** 7)}"
+            writer.writerow(["", extra, "", "", ""])
+            description += " " + extra
+
+        expected.append((day, description, amount, is_credit, balance))
+
+    GENERATED_CSV = out.getvalue()
+    GENERATED_EXPECTED = expected
+
+
 class TestCSVParserIntegration(unittest.TestCase):
     """Integration tests for CSV parser."""
 
@@ -58,6 +110,63 @@ class TestCSVParserIntegration(unittest.TestCase):
         self.assertIn('PNR', irctc.description.upper())
 
 
+class _UnseekableBytesIO(io.BytesIO):
+    """In-memory upload stream that cannot be rewound."""
+
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+
+class TestGeneratedCSVIntegration(unittest.TestCase):
+    """Parse the generated in-memory statement through CSVParser."""
+
+    def assert_matches_expected(self, transactions):
+        self.assertEqual(len(transactions), len(GENERATED_EXPECTED))
+        for txn, (day, description, amount, is_credit, balance) in zip(
+            transactions, GENERATED_EXPECTED
+        ):
+            self.assertEqual(txn.date, day)
+            self.assertEqual(txn.description, description)
+            self.assertEqual(txn.credit if is_credit else txn.debit, amount)
+            self.assertIsNone(txn.debit if is_credit else txn.credit)
+            self.assertEqual(txn.balance, balance)
+
+    def test_parse_text_stream(self):
+        """Test parsing a text file object, with multi-row merges."""
+        parser = CSVParser(io.StringIO(GENERATED_CSV))
+        self.assert_matches_expected(parser.parse())
+
+    def test_parse_binary_stream(self):
+        """Test parsing bytes, decoded with the encoding fallback."""
+        parser = CSVParser(io.BytesIO(GENERATED_CSV.encode("utf-8")))
+        self.assertEqual(len(parser.preview_rows(5)), 5)
+        self.assert_matches_expected(parser.parse())
+
+    def test_preview_reads_only_leading_rows(self):
+        """Test previewing a non-seekable stream stops after the preview rows."""
+        stream = _UnseekableBytesIO(GENERATED_CSV.encode("utf-8"))
+        parser = CSVParser(stream)
+        rows = parser.preview_rows(5)
+
+        self.assertEqual(rows[0], ["Date", "Description", "Debit", "Credit", "Balance"])
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(parser._encoding, "utf-8-sig")
+        self.assertLess(stream.tell(), len(GENERATED_CSV) // 10)
+
+    def test_parse_unseekable_stream_with_fallback_encoding(self):
+        """Test a cp1252 upload is decoded without rewinding the stream."""
+        text = GENERATED_CSV.replace("JOHN DOE", "JOSÉ DOE")
+        parser = CSVParser(_UnseekableBytesIO(text.encode("cp1252")))
+        transactions = parser.parse()
+
+        self.assertEqual(parser._encoding, "cp1252")
+        self.assertEqual(len(transactions), len(GENERATED_EXPECTED))
+        self.assertTrue(any("JOSÉ DOE" in t.description for t in transactions))
+
+
 class TestCategorizerIntegration(unittest.TestCase):
     """Integration tests for categorizer."""
 
@@ -1,17 +1,24 @@
 """
 Unit tests for date and amount parsers.
 """
+import math
 import unittest
 from datetime import date
 
+import pandas as pd
+
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from normalizer.date_parser import parse_date, is_valid_date, extract_date_from_string
+from normalizer.date_parser import (
+    parse_date, parse_date_series, is_valid_date, extract_date_from_string
+)
 from normalizer.amount_parser import (
-    parse_amount, has_valid_amount, parse_debit_credit, format_indian_currency
+    parse_amount, has_valid_amount, parse_debit_credit, format_indian_currency,
+    parse_amount_series
 )
+from parsers.pdf_parser import PDFPnLParser, _make_scorer
 
 
 class TestDateParser(unittest.TestCase):
@@ -83,6 +90,12 @@ class TestDateParser(unittest.TestCase):
         self.assertFalse(is_valid_date(""))
         self.assertFalse(is_valid_date(None))
 
+    def test_parse_date_series_matches_scalar(self):
+        """Test bulk date parsing agrees with parse_date, repeats included."""
+        values = ["15/01/2025", "15-Jan-2025", "", None, "not a date", "15/01/2025"]
+        result = parse_date_series(pd.Series(values, dtype=object)).tolist()
+        self.assertEqual(result, [parse_date(v) for v in values])
+
     def test_extract_date_from_string(self):
         """Test extracting date from text."""
         result = extract_date_from_string("Transaction on 15/01/2025 for amount")
@@ -174,6 +187,17 @@ class TestAmountParser(unittest.TestCase):
         self.assertFalse(has_valid_amount(None))
         self.assertFalse(has_valid_amount("not a number"))
 
+    def test_parse_amount_series_matches_scalar(self):
+        """Test bulk parsing agrees with parse_amount and has_valid_amount."""
+        values = ["9,17,390.58", "-500", "(1,000.00)", "1000 DR", "₹250",
+                  "", "  42 ", "abc", None, 12.5]
+        result = parse_amount_series(pd.Series(values, dtype=object)).tolist()
+        for value, parsed in zip(values, result):
+            if value is not None and has_valid_amount(value):
+                self.assertEqual(parsed, parse_amount(value))
+            else:
+                self.assertTrue(math.isnan(parsed))
+
     def test_parse_debit_credit_dr(self):
         """Test parse_debit_credit with DR indicator."""
         debit, credit = parse_debit_credit("1000 DR")
@@ -203,5 +227,101 @@ class TestAmountParser(unittest.TestCase):
         self.assertEqual(result, "₹-1,000.00")
 
 
+
+class _FakeTablePage:
+    """Stand-in for a borderless pdfplumber page with fixed tables."""
+
+    edges = []
+
+    def __init__(self, tables):
+        self.tables = tables
+
+    def extract_tables(self, table_settings=None):
+        return self.tables
+
+
+class TestPDFTableExtraction(unittest.TestCase):
+    """Tests for PDF table cleaning and row parsing."""
+
+    def setUp(self):
+        self.parser = PDFPnLParser("statement.pdf")
+
+    def test_clean_table_none_rows(self):
+        """Test None rows and cells become empty strings."""
+        table = self.parser._clean_table(
+            [["Revenue", None, "1,000"], None, [None, "  21 ", None]], 3
+        )
+        self.assertEqual(table, [["Revenue", "", "1,000"], ["", "", ""], ["", "21", ""]])
+
+    def test_table_with_none_rows(self):
+        """Test a table containing None rows parses its data rows."""
+        page = _FakeTablePage([[
+            ["Particulars", "Note", "Year ended 31 March 2024", "Year ended 31 March 2023"],
+            None,
+            ["Revenue from operations", "21", "1,23,456.00", "98,765.00"],
+            [None, None, None, None],
+            ["Other income", "22", "4,567.00", "3,210.00"],
+            ["Total income", None, "1,28,023.00", "1,01,975.00"],
+        ]])
+        items = self.parser._extract_via_tables(page, 1)
+
+        self.assertEqual(
+            [(i.label, i.note_ref, i.amounts) for i in items],
+            [
+                ("Revenue from operations", "21", (123456.0, 98765.0)),
+                ("Other income", "22", (4567.0, 3210.0)),
+                ("Total income", None, (128023.0, 101975.0)),
+            ],
+        )
+        self.assertTrue(items[2].is_total)
+
+    def test_ragged_table_with_negatives_and_nil(self):
+        """Test short rows, bracketed negatives and dash/Nil cells."""
+        page = _FakeTablePage([[
+            ["Particulars", "Year ended 31 March 2024", "Year ended 31 March 2023"],
+            ["Revenue from operations", "1,23,456.00", "98,765.00"],
+            ["Exceptional items", "(1,234.50)", "-"],
+            ["Tax expense", "Nil", "(2,000.00)"],
+            ["Finance costs", "3,456.00"],
+            ["Expenses"],
+        ]])
+        items = self.parser._extract_via_tables(page, 1)
+
+        self.assertEqual(
+            [(i.label, i.amounts) for i in items],
+            [
+                ("Revenue from operations", (123456.0, 98765.0)),
+                ("Exceptional items", (-1234.5, None)),
+                ("Tax expense", (None, -2000.0)),
+                ("Finance costs", (3456.0, None)),
+                ("Expenses", (None, None)),
+            ],
+        )
+
+
+
+class TestPDFPageScorer(unittest.TestCase):
+    """Tests for the P&L page scorer."""
+
+    def test_negative_markers_without_primary_keyword(self):
+        """Test secondary keywords can outweigh negative markers."""
+        text = (
+            "Extract from the Balance Sheet, as reviewed by the Auditor\n"
+            "Revenue from operations\nOther income\nTotal income\n"
+            "Total expenses\nProfit before tax\nCurrent tax\nDeferred tax"
+        )
+        result = _make_scorer(3.0)(text)
+
+        self.assertIsNotNone(result)
+        score, matched = result
+        self.assertEqual(score, 3.0)
+        self.assertEqual(len(matched), 7)
+
+    def test_rejects_page_below_threshold(self):
+        """Test a notes page with few P&L terms is rejected."""
+        text = "Notes to financial statements\nBalance Sheet\nOther income"
+        self.assertIsNone(_make_scorer(3.0)(text))
+
+
 if __name__ == '__main__':
     unittest.main()
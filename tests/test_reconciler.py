@@ -0,0 +1,195 @@
+"""
+Unit tests for balance reconciliation.
+"""
+import random
+import unittest
+from datetime import date, timedelta
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parsers.base_parser import Transaction
+from reconciler import BalanceReconciler
+from reconciler.balance_checker import _RECONCILE_BLOCK
+
+
+def sequential_balances(transactions, opening_balance, tolerance):
+    """Running balances computed one row at a time, as a reference."""
+    balances = []
+    running = opening_balance
+    for txn in transactions:
+        if txn.debit:
+            running -= txn.debit
+        if txn.credit:
+            running += txn.credit
+        balances.append(running)
+        if txn.balance is not None:
+            if abs(round(running - txn.balance, 2)) > tolerance:
+                running = txn.balance
+    return balances
+
+
+def make_transactions(count, seed=0):
+    """Build dated transactions with correct displayed balances."""
+    rng = random.Random(seed)
+    start = date(2024, 4, 1)
+    balance = 50000.0
+    transactions = []
+    for i in range(count):
+        debit = credit = None
+        if rng.random() < 0.6:
+            debit = round(rng.uniform(1, 5000), 2)
+            balance -= debit
+        else:
+            credit = round(rng.uniform(1, 5000), 2)
+            balance += credit
+        transactions.append(Transaction(
+            date=start + timedelta(days=i // 10),
+            description=f"TXN {i}",
+            debit=debit,
+            credit=credit,
+            balance=round(balance, 2),
+        ))
+    return transactions
+
+
+class TestBalanceReconciler(unittest.TestCase):
+    """Tests for BalanceReconciler."""
+
+    def setUp(self):
+        self.reconciler = BalanceReconciler()
+
+    def test_clean_statement_across_blocks(self):
+        """Test a statement longer than one accumulation block."""
+        transactions = make_transactions(3 * _RECONCILE_BLOCK + 7)
+        results, summary = self.reconciler.reconcile(transactions)
+
+        self.assertEqual(summary["mismatches_found"], 0)
+        self.assertEqual(summary["reconciliation_status"], "PASS")
+        self.assertEqual(len(results), len(transactions))
+        self.assertAlmostEqual(summary["closing_balance"], transactions[-1].balance, places=2)
+
+    def test_matches_sequential_balances(self):
+        """Test calculated balances equal the row-by-row computation."""
+        transactions = make_transactions(2 * _RECONCILE_BLOCK + 100, seed=1)
+        # Wrong displayed balances either side of the first block boundary;
+        # each also flags the row after it, which is out the other way
+        transactions[_RECONCILE_BLOCK - 3].balance += 250.0
+        transactions[_RECONCILE_BLOCK + 40].balance -= 10.0
+        opening = self.reconciler._infer_opening_balance(transactions)
+
+        calculated = self.reconciler._calculate_balances(transactions, opening)
+        expected = sequential_balances(transactions, opening, self.reconciler.tolerance)
+        self.assertEqual(calculated, expected)
+
+        results, summary = self.reconciler.reconcile(transactions)
+        flagged = [i for i, r in enumerate(results) if r.is_mismatch]
+        self.assertEqual(flagged, [
+            _RECONCILE_BLOCK - 3, _RECONCILE_BLOCK - 2,
+            _RECONCILE_BLOCK + 40, _RECONCILE_BLOCK + 41,
+        ])
+        self.assertEqual(summary["mismatches_found"], 4)
+
+    def test_mismatch_resets_running_balance(self):
+        """Test a wrong displayed balance resets the running balance."""
+        transactions = make_transactions(20)
+        transactions[5].balance += 100.0
+        results, _ = self.reconciler.reconcile(transactions)
+
+        self.assertTrue(results[5].is_mismatch)
+        self.assertEqual(results[5].balance_difference, -100.0)
+        self.assertIn("LESS than displayed", results[5].mismatch_reason)
+        # Running balance resets to the wrong displayed value, so the next
+        # row is out by the same amount the other way
+        self.assertTrue(results[6].is_mismatch)
+        self.assertIn("MORE than displayed", results[6].mismatch_reason)
+        self.assertFalse(any(r.is_mismatch for r in results[7:]))
+
+    def test_difference_within_rounding_slack(self):
+        """Test a difference that rounds down to the tolerance passes."""
+        reconciler = BalanceReconciler(tolerance=0.05)
+        transactions = [
+            Transaction(date=date(2024, 4, 1), description="A", debit=100.0, balance=900.0),
+            Transaction(date=date(2024, 4, 2), description="B", debit=100.0, balance=799.946),
+        ]
+        results, summary = reconciler.reconcile(transactions, opening_balance=1000.0)
+
+        self.assertFalse(results[1].is_mismatch)
+        self.assertEqual(results[1].balance_difference, 0.05)
+        self.assertEqual(summary["mismatches_found"], 0)
+
+    def test_difference_just_outside_tolerance(self):
+        """Test a difference that rounds above the tolerance is flagged."""
+        reconciler = BalanceReconciler(tolerance=0.05)
+        transactions = [
+            Transaction(date=date(2024, 4, 1), description="A", debit=100.0, balance=900.0),
+            Transaction(date=date(2024, 4, 2), description="B", debit=100.0, balance=799.944),
+        ]
+        results, summary = reconciler.reconcile(transactions, opening_balance=1000.0)
+
+        self.assertTrue(results[1].is_mismatch)
+        self.assertEqual(results[1].balance_difference, 0.06)
+        self.assertEqual(results[1].calculated_balance, 799.94)
+        self.assertEqual(summary["mismatches_found"], 1)
+
+    def test_missing_balances(self):
+        """Test rows without a displayed balance are never flagged."""
+        transactions = make_transactions(_RECONCILE_BLOCK + 50, seed=2)
+        for txn in transactions[1::3]:
+            txn.balance = None
+        transactions[100].balance = 1.0
+        results, summary = self.reconciler.reconcile(transactions)
+
+        for txn, result in zip(transactions, results):
+            if txn.balance is None:
+                self.assertFalse(result.is_mismatch)
+                self.assertIsNone(result.balance_difference)
+        self.assertEqual([i for i, r in enumerate(results) if r.is_mismatch], [100, 101])
+        self.assertEqual(summary["mismatches_found"], 2)
+
+    def test_no_balances_at_all(self):
+        """Test a statement with no balances starts from zero."""
+        transactions = [
+            Transaction(date=date(2024, 4, 1), description="A", credit=500.0),
+            Transaction(date=date(2024, 4, 2), description="B", debit=200.0),
+        ]
+        results, summary = self.reconciler.reconcile(transactions)
+
+        self.assertEqual(summary["opening_balance"], 0.0)
+        self.assertEqual([r.calculated_balance for r in results], [500.0, 300.0])
+        self.assertEqual(summary["mismatches_found"], 0)
+
+    def test_debit_only_rows(self):
+        """Test a statement made only of debits."""
+        transactions = [
+            Transaction(date=date(2024, 4, 1), description="A", debit=10.10, balance=989.90),
+            Transaction(date=date(2024, 4, 2), description="B", debit=20.20, balance=969.70),
+            Transaction(date=date(2024, 4, 3), description="C", debit=30.30, balance=939.40),
+        ]
+        results, summary = self.reconciler.reconcile(transactions)
+
+        self.assertEqual(summary["opening_balance"], 1000.0)
+        self.assertEqual([r.calculated_balance for r in results], [989.9, 969.7, 939.4])
+        self.assertAlmostEqual(summary["total_debits"], 60.6)
+        self.assertEqual(summary["total_credits"], 0)
+        self.assertEqual(summary["mismatches_found"], 0)
+
+    def test_credit_only_rows(self):
+        """Test a statement made only of credits."""
+        transactions = [
+            Transaction(date=date(2024, 4, 1), description="A", credit=0.1, balance=0.1),
+            Transaction(date=date(2024, 4, 2), description="B", credit=0.2, balance=0.3),
+            Transaction(date=date(2024, 4, 3), description="C", credit=0.3, balance=0.6),
+        ]
+        results, summary = self.reconciler.reconcile(transactions)
+
+        self.assertEqual(summary["opening_balance"], 0.0)
+        self.assertEqual([r.calculated_balance for r in results], [0.1, 0.3, 0.6])
+        self.assertEqual(summary["total_debits"], 0)
+        self.assertAlmostEqual(summary["total_credits"], 0.6)
+        self.assertEqual(summary["mismatches_found"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()